@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import CrimeStat  # Import the correct model
+from .models import CrimeStat, IncidentCounter, ReportDailyRollup, ReportGeoCell, ScheduledJob, SpikeAlert  # Import the correct model
 
 @admin.register(CrimeStat)
 class CrimeStatAdmin(admin.ModelAdmin):
@@ -24,3 +24,46 @@ class CrimeStatAdmin(admin.ModelAdmin):
             'fields': ('start_date', 'end_date', 'updated_at')
         }),
     )
+
+
+@admin.register(IncidentCounter)
+class IncidentCounterAdmin(admin.ModelAdmin):
+    # Maintained from report events; repair with `manage.py reconcile_crimestats`
+    list_display = ('incident_type', 'total_reports', 'pending', 'in_progress', 'resolved', 'rejected', 'updated_at')
+    readonly_fields = list_display
+
+
+@admin.register(ReportDailyRollup)
+class ReportDailyRollupAdmin(admin.ModelAdmin):
+    # Maintained from report events; rebuild with `manage.py rebuild_daily_rollup`
+    list_display = ('day', 'category', 'status', 'count')
+    ordering = ('-day',)
+    list_filter = ('category', 'status')
+
+
+@admin.register(ReportGeoCell)
+class ReportGeoCellAdmin(admin.ModelAdmin):
+    # Maintained from report events; rebuild with `manage.py rebuild_heatmap`
+    list_display = ('precision', 'cell', 'day', 'category', 'status', 'count')
+    ordering = ('precision', 'cell', '-day')
+    list_filter = ('precision', 'category', 'status')
+    search_fields = ('cell',)
+
+
+@admin.register(SpikeAlert)
+class SpikeAlertAdmin(admin.ModelAdmin):
+    # Written by analytics.tasks.check_crime_spike; one row per spiking key
+    list_display = ('key', 'observed', 'expected', 'z_score', 'last_alerted_at')
+    ordering = ('-last_alerted_at',)
+    search_fields = ('key',)
+
+
+@admin.register(ScheduledJob)
+class ScheduledJobAdmin(admin.ModelAdmin):
+    # Rows are created by `manage.py run_scheduler`; schedules live in analytics/jobs.py
+    list_display = ('name', 'next_run_at', 'last_success_at', 'last_duration_ms', 'run_count', 'failure_count', 'locked_by')
+    readonly_fields = (
+        'name', 'locked_until', 'locked_by', 'last_started_at', 'last_finished_at', 'last_success_at',
+        'last_duration_ms', 'last_error', 'run_count', 'failure_count',
+    )
+    ordering = ('name',)
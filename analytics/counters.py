@@ -0,0 +1,104 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from reports.models import Report
+from reports.response_cache import bump_version
+from .models import CrimeStat, IncidentCounter
+
+STATUS_FIELDS = ('pending', 'in_progress', 'resolved', 'rejected')
+
+INCIDENT_TYPES = {value for value, _ in CrimeStat.INCIDENT_TYPE_CHOICES}
+
+
+def _incident_type(category):
+    return category if category in INCIDENT_TYPES else 'other'
+
+
+def _ensure_rows(incident_types):
+    IncidentCounter.objects.bulk_create(
+        [IncidentCounter(incident_type=incident_type) for incident_type in incident_types],
+        ignore_conflicts=True,
+    )
+
+
+def apply_deltas(deltas):
+    """
+    Apply report count changes to the counter rows.
+
+    `deltas` is an iterable of (category, status, step) where step is +1 for
+    a report entering that bucket and -1 for one leaving it. Changes are
+    summed per incident type and written as one `UPDATE ... SET x = x + n`
+    per type, so concurrent writers never lose an increment.
+    """
+    per_type = defaultdict(lambda: defaultdict(int))
+    for category, status, step in deltas:
+        fields = per_type[_incident_type(category)]
+        fields['total_reports'] += step
+        if status in STATUS_FIELDS:
+            fields[status] += step
+
+    now = timezone.now()
+    for incident_type, fields in per_type.items():
+        changes = {
+            # Never below zero: drift is repaired by reconcile(), not by
+            # failing the report write that exposed it.
+            name: Greatest(F(name) + step, Value(0))
+            for name, step in fields.items() if step
+        }
+        if not changes:
+            continue
+        rows = IncidentCounter.objects.filter(incident_type=incident_type)
+        if not rows.update(updated_at=now, **changes):
+            _ensure_rows([incident_type])
+            rows.update(updated_at=now, **changes)
+
+
+def expected_counts():
+    """Exact per-incident-type counters, computed from the Report table."""
+    expected = {
+        incident_type: dict.fromkeys(('total_reports',) + STATUS_FIELDS, 0)
+        for incident_type in INCIDENT_TYPES
+    }
+    rows = Report.objects.order_by().values('category', 'status').annotate(count=Count('id'))
+    for row in rows:
+        counts = expected[_incident_type(row['category'])]
+        counts['total_reports'] += row['count']
+        if row['status'] in STATUS_FIELDS:
+            counts[row['status']] += row['count']
+    return expected
+
+
+def reconcile(fix=True):
+    """
+    Compare the counter rows with a full recount and, if `fix`, overwrite the
+    ones that drifted. Returns {incident_type: (stored, expected)} for every
+    drifting row.
+
+    The counter rows are locked before recounting, so writers that commit
+    meanwhile apply their deltas on top of the corrected values.
+    """
+    with transaction.atomic():
+        _ensure_rows(INCIDENT_TYPES)
+        stored = {
+            row['incident_type']: row
+            for row in IncidentCounter.objects.select_for_update().values('incident_type', 'total_reports', *STATUS_FIELDS)
+        }
+        expected = expected_counts()
+
+        drift = {}
+        for incident_type, counts in expected.items():
+            current = {name: stored[incident_type][name] for name in counts}
+            if current != counts:
+                drift[incident_type] = (current, counts)
+
+        if fix and drift:
+            now = timezone.now()
+            for incident_type, (_, counts) in drift.items():
+                IncidentCounter.objects.filter(incident_type=incident_type).update(updated_at=now, **counts)
+            bump_version('crimestats')
+
+    return drift
@@ -0,0 +1,130 @@
+"""
+Precomputed report density per geohash cell for map tiles.
+
+Every report is counted once per zoom precision in ReportGeoCell, keyed by
+(precision, cell, day, category, status) and kept current from report
+events like the daily rollup. A tile request is one range scan over the
+(precision, cell) prefix of the unique index, whatever the report volume.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Substr, TruncDate
+
+from reports import geo
+from reports.models import Report
+from reports.response_cache import bump_version
+from .models import ReportGeoCell
+from .upsert import add_counts, set_counts
+
+# Geohash precision behind each zoom level: ~4.9km, ~1.2km and ~150m cells.
+ZOOM_PRECISIONS = {
+    'city': 5,
+    'district': 6,
+    'street': 7,
+}
+PRECISIONS = tuple(sorted(set(ZOOM_PRECISIONS.values())))
+
+# A tile asking for more cells than this must use a coarser zoom.
+MAX_TILE_CELLS = 10000
+
+KEY_FIELDS = ('precision', 'cell', 'day', 'category', 'status')
+
+
+def apply_deltas(deltas):
+    """
+    Apply report count changes to the heatmap cells.
+
+    `deltas` is an iterable of (day, geohash, category, status, step); each
+    one moves every zoom precision's cell for that geohash. Steps are summed
+    per key and the whole batch is written with one upsert (see upsert.py).
+    """
+    per_key = defaultdict(int)
+    for day, geohash, category, status, step in deltas:
+        if not geohash:
+            continue
+        for precision in PRECISIONS:
+            per_key[(precision, geohash[:precision], day, category, status)] += step
+    add_counts(ReportGeoCell, KEY_FIELDS, per_key)
+
+
+def rebuild(since=None):
+    """
+    Recompute the heatmap cells from the Report table, for every day or from
+    `since` (a date) onwards. Returns the number of cell rows written.
+
+    Rows are overwritten in place (see upsert.set_counts), so report writes
+    running meanwhile keep upserting into them instead of racing a delete.
+    """
+    reports = Report.objects.order_by()
+    if since is not None:
+        reports = reports.filter(created_at__date__gte=since)
+
+    with transaction.atomic():
+        existing = ReportGeoCell.objects.all()
+        if since is not None:
+            existing = existing.filter(day__gte=since)
+        # Keys that no longer have reports are zeroed, then dropped.
+        counts = dict.fromkeys(existing.values_list(*KEY_FIELDS), 0)
+        recounted = {}
+        for precision in PRECISIONS:
+            grouped = (
+                reports.exclude(geohash='')
+                .annotate(day=TruncDate('created_at'), cell=Substr('geohash', 1, precision))
+                .values_list('cell', 'day', 'category', 'status')
+                .annotate(count=Count('id'))
+            )
+            for cell, day, category, status, count in grouped.iterator():
+                recounted[(precision, cell, day, category, status)] = count
+        counts.update(recounted)
+        set_counts(ReportGeoCell, KEY_FIELDS, counts)
+        existing.filter(count=0).delete()
+        bump_version('reports')
+    return len(recounted)
+
+
+def tile_cell_count(min_lat, min_lon, max_lat, max_lon, precision):
+    """Upper bound on the number of cells at `precision` inside the box."""
+    lat_step, lon_step = geo.cell_size(precision)
+    return (int((max_lat - min_lat) / lat_step) + 2) * (int((max_lon - min_lon) / lon_step) + 2)
+
+
+def tile(min_lat, min_lon, max_lat, max_lon, precision, categories=None, statuses=None, since=None, until=None):
+    """
+    Report counts per cell at `precision` for the cells overlapping the box,
+    optionally restricted to categories, statuses and days in [since, until).
+    Returns a list of {'cell', 'lat', 'lon', 'count'} (cell centres), densest
+    first.
+    """
+    # Precision inside every branch, so each range is its own index seek.
+    cell_ranges = Q()
+    for prefix in {prefix[:precision] for prefix in geo.cover(min_lat, min_lon, max_lat, max_lon)}:
+        cell_ranges |= Q(precision=precision, cell__range=geo.prefix_range(prefix))
+    cells = ReportGeoCell.objects.filter(cell_ranges)
+
+    if categories:
+        cells = cells.filter(category__in=categories)
+    if statuses:
+        cells = cells.filter(status__in=statuses)
+    if since is not None:
+        cells = cells.filter(day__gte=since)
+    if until is not None:
+        cells = cells.filter(day__lt=until)
+
+    results = []
+    for row in cells.order_by().values('cell').annotate(count=Sum('count')):
+        if not row['count']:
+            continue
+        cell_min_lat, cell_min_lon, cell_max_lat, cell_max_lon = geo.bounds(row['cell'])
+        # The cover cells overhang the box; drop cells entirely outside it.
+        if cell_min_lat > max_lat or cell_max_lat < min_lat or cell_min_lon > max_lon or cell_max_lon < min_lon:
+            continue
+        results.append({
+            'cell': row['cell'],
+            'lat': (cell_min_lat + cell_max_lat) / 2,
+            'lon': (cell_min_lon + cell_max_lon) / 2,
+            'count': row['count'],
+        })
+    results.sort(key=lambda item: -item['count'])
+    return results
@@ -0,0 +1,35 @@
+"""
+Periodic analytics jobs, run by `manage.py run_scheduler`.
+
+Cron times are in settings.TIME_ZONE. The incremental counters, rollups
+and heatmap cells are repaired nightly from the Report table, so drift
+from writes that bypass the report signals never lasts long.
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+
+from . import counters, heatmap, rollups, snapshot, tasks
+from .scheduler import job
+
+
+@job('check_crime_spike', every=timedelta(minutes=10), jitter=timedelta(seconds=30))
+def check_crime_spike():
+    tasks.check_crime_spike()
+
+
+@job('reconcile_crimestats', cron='15 3 * * *', jitter=timedelta(minutes=2))
+def reconcile_crimestats():
+    counters.reconcile()
+
+
+@job('rebuild_recent_rollups', cron='30 3 * * *', jitter=timedelta(minutes=2), timeout=timedelta(hours=1))
+def rebuild_recent_rollups():
+    since = timezone.localdate() - timedelta(days=2)
+    rollups.rebuild(since=since)
+    heatmap.rebuild(since=since)
+
+
+@job('snapshot_reports', cron='0 2 * * *', jitter=timedelta(minutes=2), timeout=timedelta(hours=1))
+def snapshot_reports():
+    snapshot.write_snapshot()
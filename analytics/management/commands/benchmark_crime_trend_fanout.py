@@ -0,0 +1,92 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from notifications.broadcasts import broadcast
+from notifications.models import Notification
+from notifications.signals import notifications_created
+
+ROLES = ['admin', 'law_enforcement']
+
+CHUNK_SIZE = 1000
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the crime-trend notification for --recipients admin and law-enforcement "
+        "users: one create() per user, chunked bulk_create of one row per user, and the "
+        "per-role broadcast the signal sends now. Everything runs in a transaction that "
+        "is rolled back, so the database is left as it was."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--recipients', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        if options['recipients'] < 1:
+            raise CommandError("--recipients must be positive")
+        fields = {'message': "Crime statistics updated: theft - 1 reports.", 'notification_type': 'crime_trend'}
+
+        with transaction.atomic():
+            User = get_user_model()
+            User.objects.bulk_create(
+                [
+                    User(
+                        email=f'fanout-benchmark-{index}@example.invalid',
+                        username=f'fanout-benchmark-{index}',
+                        role=ROLES[index % len(ROLES)],
+                        password='!',
+                    )
+                    for index in range(options['recipients'])
+                ],
+                batch_size=CHUNK_SIZE,
+            )
+            recipients = User.objects.filter(role__in=ROLES)
+
+            def per_user():
+                for user in recipients:
+                    Notification.objects.create(recipient=user, **fields)
+
+            def chunked_bulk():
+                ids = recipients.values_list('id', flat=True).iterator(chunk_size=CHUNK_SIZE)
+                chunk = []
+                for user_id in ids:
+                    chunk.append(Notification(recipient_id=user_id, **fields))
+                    if len(chunk) == CHUNK_SIZE:
+                        notifications_created.send(sender=Notification, notifications=Notification.objects.bulk_create(chunk))
+                        chunk = []
+                if chunk:
+                    notifications_created.send(sender=Notification, notifications=Notification.objects.bulk_create(chunk))
+
+            def role_broadcast():
+                broadcast(ROLES, **fields)
+
+            self.stdout.write(f"{recipients.count()} recipients")
+            for name, run in (
+                ('per-user create()', per_user),
+                ('chunked bulk_create', chunked_bulk),
+                ('role broadcast', role_broadcast),
+            ):
+                # Each variant runs in its own savepoint, undone afterwards.
+                savepoint = transaction.savepoint()
+                queries = QueryCounter()
+                with connection.execute_wrapper(queries):
+                    started = time.perf_counter()
+                    run()
+                    elapsed = time.perf_counter() - started
+                transaction.savepoint_rollback(savepoint)
+                self.stdout.write(f"{name:<20} {elapsed:8.3f}s  {queries.count:>6} queries")
+
+            transaction.set_rollback(True)
+        self.stdout.write(self.style.SUCCESS("Done; the benchmark users and notifications were rolled back."))
@@ -0,0 +1,97 @@
+import random
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from analytics import timeseries
+from reports.models import Report
+
+INSERT_BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the report time-series on synthetic reports spread over one year, against "
+        "a per-row Python count. The reports are written in a transaction that is rolled "
+        "back, so the database is left as it was."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000000)
+        parser.add_argument('--days', type=int, default=365, help="Span the reports are spread over")
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        if options['rows'] < 1 or options['days'] < 1:
+            raise CommandError("--rows and --days must be positive")
+
+        with transaction.atomic():
+            end = timezone.now()
+            start = end - timedelta(days=options['days'])
+            started = time.perf_counter()
+            self._populate(start, end, options['rows'], options['seed'])
+            self.stdout.write(f"Inserted {options['rows']} reports in {time.perf_counter() - started:.1f}s")
+
+            reports = Report.objects.all()
+            for bucket in timeseries.BUCKETS:
+                if timeseries.bucket_edges(start, end, bucket) is None:
+                    continue
+                for group_by in (None, 'category', 'status'):
+                    started = time.perf_counter()
+                    timeseries.report_timeseries(reports, start, end, bucket=bucket, group_by=group_by)
+                    self.stdout.write(f"{bucket:<6} {group_by or 'total':<9} {time.perf_counter() - started:8.2f}s")
+
+            # Baseline: per-row Python objects, counted by day and category.
+            started = time.perf_counter()
+            Counter(
+                reports.filter(created_at__gte=start, created_at__lt=end)
+                .annotate(day=TruncDate('created_at'))
+                .values_list('day', 'category')
+                .iterator()
+            )
+            self.stdout.write(f"per-row Python (day x category) {time.perf_counter() - started:8.2f}s")
+
+            transaction.set_rollback(True)
+        self.stdout.write(self.style.SUCCESS("Done; the benchmark reports were rolled back."))
+
+    def _populate(self, start, end, rows, seed):
+        rng = random.Random(seed)
+        user = get_user_model().objects.create(email='timeseries-benchmark@example.invalid', role='citizen')
+        categories = [value for value, _ in Report.CATEGORY_CHOICES]
+        statuses = [value for value, _ in Report.STATUS_CHOICES]
+        span = int((end - start).total_seconds())
+
+        for offset in range(0, rows, INSERT_BATCH_SIZE):
+            size = min(INSERT_BATCH_SIZE, rows - offset)
+            created = Report.objects.bulk_create([
+                Report(
+                    user=user,
+                    category=rng.choice(categories),
+                    description='Benchmark report',
+                    status=rng.choice(statuses),
+                    latitude=rng.uniform(-4.5, 4.5),
+                    longitude=rng.uniform(33.5, 42.0),
+                )
+                for _ in range(size)
+            ])
+            # created_at is auto_now_add, so bulk_create stamps every row with
+            # now; spread them over the range afterwards.
+            with connection.cursor() as cursor:
+                cursor.executemany(
+                    f'UPDATE {Report._meta.db_table} SET created_at = %s WHERE id = %s',
+                    [
+                        (
+                            connection.ops.adapt_datetimefield_value(
+                                start + timedelta(seconds=rng.randrange(span), microseconds=rng.randrange(10 ** 6))
+                            ),
+                            report.pk,
+                        )
+                        for report in created
+                    ],
+                )
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from analytics.heatmap import rebuild
+
+
+class Command(BaseCommand):
+    help = "Rebuild the report heatmap cells from the Report table (all days, or from --since)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since', help="First day to rebuild (YYYY-MM-DD); defaults to every day")
+
+    def handle(self, *args, **options):
+        since = None
+        if options['since']:
+            since = parse_date(options['since'])
+            if since is None:
+                raise CommandError(f"Invalid date: {options['since']!r}")
+
+        written = rebuild(since=since)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} heatmap cell row(s)."))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from analytics.counters import reconcile
+
+
+class Command(BaseCommand):
+    help = "Recount reports per incident type and repair drifted incident counters."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="Report drift without fixing it")
+
+    def handle(self, *args, **options):
+        drift = reconcile(fix=not options['dry_run'])
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Incident counters are in sync."))
+            return
+
+        for incident_type, (stored, expected) in sorted(drift.items()):
+            self.stdout.write(f"{incident_type}: stored={stored} expected={expected}")
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f"{len(drift)} counter row(s) drifted (not fixed)."))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Fixed {len(drift)} counter row(s)."))
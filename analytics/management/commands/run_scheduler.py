@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from analytics import scheduler
+from analytics.models import ScheduledJob
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the periodic analytics jobs. Safe to start on every host: each run "
+        "is claimed through a database lease, so only one process executes it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Run the jobs that are due now, then exit")
+        parser.add_argument('--list', action='store_true', help="Show the registered jobs and their metrics")
+        parser.add_argument('--run', metavar='JOB', help="Make JOB due now (it runs on the next pass)")
+        parser.add_argument('--poll', type=int, default=30, help="Maximum seconds between passes (default 30)")
+
+    def handle(self, *args, **options):
+        scheduler.sync_jobs()
+
+        if options['run']:
+            if options['run'] not in scheduler.registry:
+                raise CommandError(f"Unknown job: {options['run']}")
+            ScheduledJob.objects.filter(name=options['run']).update(next_run_at=timezone.now())
+
+        if options['list']:
+            rows = {row.name: row for row in ScheduledJob.objects.filter(name__in=list(scheduler.registry))}
+            for name, entry in scheduler.registry.items():
+                row = rows[name]
+                self.stdout.write(
+                    f"{name:<24} {entry.trigger!s:<24} next={row.next_run_at:%Y-%m-%d %H:%M:%S} "
+                    f"runs={row.run_count} failures={row.failure_count} last_ms={row.last_duration_ms} "
+                    f"last_success={row.last_success_at or '-'}"
+                    + (f" error={row.last_error}" if row.last_error else "")
+                )
+            return
+
+        if options['once']:
+            ran = scheduler.run_pending()
+            self.stdout.write(self.style.SUCCESS(f"Ran {len(ran)} job(s): {', '.join(ran) or '-'}"))
+            return
+
+        self.stdout.write(f"Scheduler started with {len(scheduler.registry)} job(s).")
+        try:
+            scheduler.run_forever(poll=options['poll'])
+        except KeyboardInterrupt:
+            self.stdout.write("Scheduler stopped.")
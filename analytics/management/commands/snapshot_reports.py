@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from analytics.snapshot import write_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Write a columnar, memory-mappable snapshot of the Report table to "
+        "REPORT_SNAPSHOT_DIR and make it the current one."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dir', help="Snapshot directory; defaults to settings.REPORT_SNAPSHOT_DIR")
+        parser.add_argument('--keep', type=int, help="Snapshots to keep; defaults to settings.REPORT_SNAPSHOT_KEEP")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        snapshot = write_snapshot(root=options['dir'], keep=options['keep'])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {len(snapshot)} report(s) to {snapshot.path} in {elapsed:.2f}s."
+        ))
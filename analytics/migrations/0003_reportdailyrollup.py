@@ -0,0 +1,48 @@
+# Generated by Django 5.2 on 2026-10-18 06:25
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def backfill_rollup(apps, schema_editor):
+    Report = apps.get_model('reports', 'Report')
+    ReportDailyRollup = apps.get_model('analytics', 'ReportDailyRollup')
+    grouped = (
+        Report.objects.order_by()
+        .annotate(day=TruncDate('created_at'))
+        .values('day', 'category', 'status')
+        .annotate(count=Count('id'))
+    )
+    ReportDailyRollup.objects.bulk_create(
+        [ReportDailyRollup(**row) for row in grouped.iterator()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_crimestat_in_progress_crimestat_pending_and_more'),
+        ('reports', '0012_report_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('category', models.CharField(max_length=50)),
+                ('status', models.CharField(max_length=20)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Daily Report Rollup',
+                'verbose_name_plural': 'Daily Report Rollups',
+                'ordering': ['day'],
+                'unique_together': {('day', 'category', 'status')},
+            },
+        ),
+        migrations.RunPython(backfill_rollup, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-18 06:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_reportdailyrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpikeAlert',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True)),
+                ('observed', models.PositiveIntegerField(default=0)),
+                ('expected', models.FloatField(default=0)),
+                ('z_score', models.FloatField(default=0)),
+                ('last_alerted_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Spike Alert',
+                'verbose_name_plural': 'Spike Alerts',
+                'ordering': ['-last_alerted_at'],
+            },
+        ),
+    ]
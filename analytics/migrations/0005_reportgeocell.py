@@ -0,0 +1,53 @@
+# Generated by Django 5.2 on 2026-10-18 06:32
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Substr, TruncDate
+
+# Frozen copy of analytics.heatmap.PRECISIONS at the time of this migration.
+PRECISIONS = (5, 6, 7)
+
+
+def backfill_cells(apps, schema_editor):
+    Report = apps.get_model('reports', 'Report')
+    ReportGeoCell = apps.get_model('analytics', 'ReportGeoCell')
+    for precision in PRECISIONS:
+        grouped = (
+            Report.objects.order_by()
+            .exclude(geohash='')
+            .annotate(day=TruncDate('created_at'), cell=Substr('geohash', 1, precision))
+            .values('cell', 'day', 'category', 'status')
+            .annotate(count=Count('id'))
+        )
+        ReportGeoCell.objects.bulk_create(
+            [ReportGeoCell(precision=precision, **row) for row in grouped.iterator()],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0004_spikealert'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportGeoCell',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('precision', models.PositiveSmallIntegerField()),
+                ('cell', models.CharField(max_length=12)),
+                ('day', models.DateField()),
+                ('category', models.CharField(max_length=50)),
+                ('status', models.CharField(max_length=20)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Report Geo Cell',
+                'verbose_name_plural': 'Report Geo Cells',
+                'unique_together': {('precision', 'cell', 'day', 'category', 'status')},
+            },
+        ),
+        migrations.RunPython(backfill_cells, migrations.RunPython.noop),
+    ]
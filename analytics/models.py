@@ -83,3 +83,132 @@ class CrimeStat(models.Model):
 
     def __str__(self):
         return f"{self.incident_type} - {self.total_reports} reports ({self.status})"
+
+
+class IncidentCounter(models.Model):
+    """
+    Live report counts per incident type, kept current from report events
+    (see analytics/counters.py) and repaired by `manage.py reconcile_crimestats`.
+    """
+    incident_type = models.CharField(max_length=50, choices=CrimeStat.INCIDENT_TYPE_CHOICES, unique=True)
+    total_reports = models.PositiveIntegerField(default=0)
+    pending = models.PositiveIntegerField(default=0)
+    in_progress = models.PositiveIntegerField(default=0)
+    resolved = models.PositiveIntegerField(default=0)
+    rejected = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['incident_type']
+        verbose_name = "Incident Counter"
+        verbose_name_plural = "Incident Counters"
+
+    def __str__(self):
+        return f"{self.incident_type}: {self.total_reports} reports"
+
+
+class ReportDailyRollup(models.Model):
+    """
+    Number of reports created on `day` per (category, status), kept current
+    from report events (see analytics/rollups.py). Summaries read this table
+    instead of grouping raw reports, so their cost follows days, not reports.
+    """
+    day = models.DateField()
+    category = models.CharField(max_length=50)
+    status = models.CharField(max_length=20)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['day']
+        unique_together = ('day', 'category', 'status')
+        verbose_name = "Daily Report Rollup"
+        verbose_name_plural = "Daily Report Rollups"
+
+    def __str__(self):
+        return f"{self.day} {self.category}/{self.status}: {self.count}"
+
+
+class SpikeAlert(models.Model):
+    """
+    Last alert raised per spike key ('category:theft', 'cell:u4pru'). The
+    periodic spike check reads these to honour the cooldown across runs.
+    """
+    key = models.CharField(max_length=64, unique=True)
+    observed = models.PositiveIntegerField(default=0)
+    expected = models.FloatField(default=0)
+    z_score = models.FloatField(default=0)
+    last_alerted_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-last_alerted_at']
+        verbose_name = "Spike Alert"
+        verbose_name_plural = "Spike Alerts"
+
+    def __str__(self):
+        return f"{self.key}: {self.observed} vs {self.expected:.1f} expected at {self.last_alerted_at}"
+
+
+class ReportGeoCell(models.Model):
+    """
+    Number of reports created on `day` per (category, status) inside the
+    geohash `cell`, stored once per heatmap precision and kept current from
+    report events (see analytics/heatmap.py).
+    """
+    precision = models.PositiveSmallIntegerField()
+    cell = models.CharField(max_length=12)
+    day = models.DateField()
+    category = models.CharField(max_length=50)
+    status = models.CharField(max_length=20)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        # The unique index doubles as the tile lookup: precision, then a cell range.
+        unique_together = ('precision', 'cell', 'day', 'category', 'status')
+        verbose_name = "Report Geo Cell"
+        verbose_name_plural = "Report Geo Cells"
+
+    def __str__(self):
+        return f"{self.cell} {self.day} {self.category}/{self.status}: {self.count}"
+
+
+class ReportTombstone(models.Model):
+    """
+    Id of a deleted report and when it went. Snapshot readers drop the ids
+    deleted since their snapshot was taken (see analytics/snapshot.py);
+    writing a snapshot prunes the rows no retained snapshot needs.
+    """
+    report_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        verbose_name = "Report Tombstone"
+        verbose_name_plural = "Report Tombstones"
+
+    def __str__(self):
+        return f"Report {self.report_id} deleted at {self.deleted_at}"
+
+
+class ScheduledJob(models.Model):
+    """
+    Schedule, lease and run metrics of one periodic job (analytics/scheduler.py).
+    A runner owns the job while `locked_until` is in the future.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    next_run_at = models.DateTimeField()
+    locked_until = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=255, blank=True, default='')
+    last_started_at = models.DateTimeField(null=True, blank=True)
+    last_finished_at = models.DateTimeField(null=True, blank=True)
+    last_success_at = models.DateTimeField(null=True, blank=True)
+    last_duration_ms = models.PositiveIntegerField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default='')
+    run_count = models.PositiveIntegerField(default=0)
+    failure_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['name']
+        verbose_name = "Scheduled Job"
+        verbose_name_plural = "Scheduled Jobs"
+
+    def __str__(self):
+        return f"{self.name} (next run {self.next_run_at})"
@@ -0,0 +1,63 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from reports.models import Report
+from reports.response_cache import bump_version
+from .models import ReportDailyRollup
+from .upsert import add_counts, set_counts
+
+KEY_FIELDS = ('day', 'category', 'status')
+
+
+def report_day(created_at):
+    """Rollup day of a report; matches TruncDate('created_at') in the current timezone."""
+    return timezone.localdate(created_at)
+
+
+def apply_deltas(deltas):
+    """
+    Apply report count changes to the daily rollup.
+
+    `deltas` is an iterable of (day, category, status, step). Steps are summed
+    per key and the whole batch is written with one upsert (see upsert.py).
+    """
+    per_key = defaultdict(int)
+    for day, category, status, step in deltas:
+        per_key[(day, category, status)] += step
+    add_counts(ReportDailyRollup, KEY_FIELDS, per_key)
+
+
+def rebuild(since=None):
+    """
+    Recompute the rollup from the Report table, for every day or from `since`
+    (a date) onwards. Returns the number of rollup rows written.
+
+    Rows are overwritten in place (see upsert.set_counts), so report writes
+    running meanwhile keep upserting into them instead of racing a delete.
+    """
+    reports = Report.objects.order_by()
+    if since is not None:
+        reports = reports.filter(created_at__date__gte=since)
+
+    grouped = (
+        reports.annotate(day=TruncDate('created_at'))
+        .values_list('day', 'category', 'status')
+        .annotate(count=Count('id'))
+    )
+
+    with transaction.atomic():
+        existing = ReportDailyRollup.objects.all()
+        if since is not None:
+            existing = existing.filter(day__gte=since)
+        # Keys that no longer have reports are zeroed, then dropped.
+        counts = dict.fromkeys(existing.values_list('day', 'category', 'status'), 0)
+        recounted = {(day, category, status): count for day, category, status, count in grouped.iterator()}
+        counts.update(recounted)
+        set_counts(ReportDailyRollup, KEY_FIELDS, counts)
+        existing.filter(count=0).delete()
+        bump_version('reports')
+    return len(recounted)
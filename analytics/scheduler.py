@@ -0,0 +1,219 @@
+"""
+Lightweight periodic job scheduler (no Celery or broker).
+
+Jobs register themselves with `@job(...)` and an interval or cron trigger.
+`manage.py run_scheduler` can run on every host: each due job is claimed by
+a single conditional UPDATE on its ScheduledJob row that also takes a
+lease, so exactly one process runs it, and a crashed runner's lease simply
+expires. The same row records duration, success and failure metrics.
+"""
+import logging
+import os
+import random
+import socket
+import time
+from datetime import datetime, timedelta
+
+from django.db import close_old_connections
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import ScheduledJob
+
+logger = logging.getLogger(__name__)
+
+
+class Interval:
+    def __init__(self, every):
+        self.every = every
+
+    def next_after(self, moment):
+        return moment + self.every
+
+    def __str__(self):
+        return f"every {self.every}"
+
+
+class Cron:
+    """
+    Five-field cron expression (minute hour day-of-month month day-of-week)
+    in the current timezone. Fields accept *, numbers, ranges, lists and
+    /steps; day-of-week is 0-6 from Sunday (7 is Sunday too).
+    """
+    BOUNDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, expression):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        self.expression = expression
+        (self.minutes, self.hours, self.days, self.months, weekdays) = (
+            self._parse(field, low, high) for field, (low, high) in zip(fields, self.BOUNDS)
+        )
+        self.weekdays = {day % 7 for day in weekdays}
+        self.any_day = fields[2] == '*'
+        self.any_weekday = fields[4] == '*'
+
+    @staticmethod
+    def _parse(field, low, high):
+        values = set()
+        for part in field.split(','):
+            spec, _, step = part.partition('/')
+            step = int(step) if step else 1
+            if spec == '*':
+                start, end = low, high
+            elif '-' in spec:
+                start, end = (int(value) for value in spec.split('-', 1))
+            else:
+                start = end = int(spec)
+                if step > 1:
+                    end = high
+            if not low <= start <= end <= high or step < 1:
+                raise ValueError(f"Invalid cron field: {field!r}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, day):
+        in_month = day.day in self.days
+        in_week = (day.weekday() + 1) % 7 in self.weekdays
+        # Classic cron: when both are restricted, either one matching is enough.
+        if self.any_day or self.any_weekday:
+            return in_month and in_week
+        return in_month or in_week
+
+    def next_after(self, moment):
+        local = timezone.localtime(moment).replace(tzinfo=None, second=0, microsecond=0) + timedelta(minutes=1)
+        limit = local + timedelta(days=366 * 5)
+        while local < limit:
+            if local.month not in self.months or not self._day_matches(local):
+                local = datetime.combine(local.date() + timedelta(days=1), datetime.min.time())
+            elif local.hour not in self.hours:
+                local = local.replace(minute=0) + timedelta(hours=1)
+            elif local.minute not in self.minutes:
+                local += timedelta(minutes=1)
+            else:
+                return timezone.make_aware(local)
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
+
+    def __str__(self):
+        return f"cron '{self.expression}'"
+
+
+class Job:
+    def __init__(self, name, func, trigger, jitter, timeout):
+        self.name = name
+        self.func = func
+        self.trigger = trigger
+        self.jitter = jitter
+        self.timeout = timeout
+
+    def next_run_after(self, moment):
+        delay = random.uniform(0, self.jitter.total_seconds()) if self.jitter else 0
+        return self.trigger.next_after(moment) + timedelta(seconds=delay)
+
+
+registry = {}
+
+
+def job(name, every=None, cron=None, jitter=timedelta(0), timeout=timedelta(minutes=15)):
+    """
+    Register the decorated function as a periodic job.
+
+    Exactly one of `every` (a timedelta) or `cron` (a 5-field expression)
+    sets the schedule. Up to `jitter` is added to every run time so hosts do
+    not hit the database in lockstep. A run is expected to finish within
+    `timeout`; afterwards another host may claim the job again.
+    """
+    if (every is None) == (cron is None):
+        raise ValueError("Give exactly one of `every` or `cron`.")
+    trigger = Interval(every) if every is not None else Cron(cron)
+
+    def register(func):
+        registry[name] = Job(name, func, trigger, jitter, timeout)
+        return func
+    return register
+
+
+def worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def sync_jobs(now=None):
+    """Create the ScheduledJob row of every registered job that has none."""
+    now = now or timezone.now()
+    ScheduledJob.objects.bulk_create(
+        [ScheduledJob(name=name, next_run_at=entry.next_run_after(now)) for name, entry in registry.items()],
+        ignore_conflicts=True,
+    )
+
+
+def claim(entry, now):
+    """Take the job's lease if it is due and not running elsewhere. Returns True if taken."""
+    return bool(
+        ScheduledJob.objects.filter(name=entry.name, next_run_at__lte=now)
+        .filter(Q(locked_until__isnull=True) | Q(locked_until__lte=now))
+        .update(locked_until=now + entry.timeout, locked_by=worker_id(), last_started_at=now)
+    )
+
+
+def run_job(entry):
+    """Run one claimed job and record its outcome; the lease is released either way."""
+    started = time.monotonic()
+    error = ''
+    try:
+        entry.func()
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        logger.exception("Scheduled job %s failed", entry.name)
+    duration_ms = int((time.monotonic() - started) * 1000)
+
+    finished = timezone.now()
+    changes = {
+        'locked_until': None,
+        'locked_by': '',
+        'last_finished_at': finished,
+        'last_duration_ms': duration_ms,
+        'last_error': error,
+        'next_run_at': entry.next_run_after(finished),
+        'run_count': F('run_count') + 1,
+    }
+    if error:
+        changes['failure_count'] = F('failure_count') + 1
+    else:
+        changes['last_success_at'] = finished
+    ScheduledJob.objects.filter(name=entry.name, locked_by=worker_id()).update(**changes)
+    logger.info("Scheduled job %s finished in %d ms%s", entry.name, duration_ms, f" ({error})" if error else "")
+    return not error
+
+
+def run_pending():
+    """Run every registered job that is due and can be claimed. Returns the names run."""
+    ran = []
+    for entry in registry.values():
+        now = timezone.now()
+        if claim(entry, now):
+            run_job(entry)
+            ran.append(entry.name)
+    return ran
+
+
+def seconds_until_next(max_wait):
+    """Seconds until the next claimable run, capped at `max_wait` (jobs leased elsewhere are skipped)."""
+    now = timezone.now()
+    upcoming = (
+        ScheduledJob.objects.filter(name__in=list(registry))
+        .filter(Q(locked_until__isnull=True) | Q(locked_until__lte=now))
+        .order_by('next_run_at').values_list('next_run_at', flat=True).first()
+    )
+    if upcoming is None:
+        return max_wait
+    return min(max_wait, max(0.0, (upcoming - now).total_seconds()))
+
+
+def run_forever(poll=30, stop=None):
+    """Scheduler loop: run due jobs, then sleep until the next one (at most `poll` seconds)."""
+    sync_jobs()
+    while stop is None or not stop():
+        close_old_connections()
+        run_pending()
+        time.sleep(max(1.0, seconds_until_next(poll)))
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import CrimeStat
+from .models import CrimeStat, IncidentCounter
 
 class CrimeStatSerializer(serializers.ModelSerializer):
     # Ensuring that the choices fields are serialized correctly
@@ -15,3 +15,9 @@ class CrimeStatSerializer(serializers.ModelSerializer):
         fields = ['id', 'incident_type', 'total_reports', 'user_role', 'status', 'start_date', 'end_date', 'updated_at']
         read_only_fields = ['id', 'updated_at']  # Prevent modifications to 'id' and 'updated_at'
 
+
+class IncidentCounterSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = IncidentCounter
+        fields = ['incident_type', 'total_reports', 'pending', 'in_progress', 'resolved', 'rejected', 'updated_at']
+        read_only_fields = fields
@@ -1,24 +1,93 @@
-from django.db.models.signals import post_save
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from django.contrib.auth import get_user_model
 
-from .models import CrimeStat
-from notifications.models import Notification
+from . import counters, heatmap, rollups
+from .models import CrimeStat, ReportTombstone
+from notifications.broadcasts import broadcast
+from reports.models import Report
+from reports.response_cache import bump_version
+from reports.signals import report_status_changed, reports_created
 
-User = get_user_model()
 
 @receiver(post_save, sender=CrimeStat)
 def create_crimestat_notification(sender, instance, created, **kwargs):
     if created:  # Only send notification when a new CrimeStat is created
         message = f"Crime statistics updated: {instance.incident_type} - {instance.total_reports} reports."
 
-        # Get all users with the roles 'admin' and 'law_enforcement'
-        users_to_notify = User.objects.filter(role__in=['admin', 'law_enforcement'])
+        # One broadcast row per role, sent once the CrimeStat is committed.
+        transaction.on_commit(partial(
+            broadcast, ['admin', 'law_enforcement'], message=message, notification_type='crime_trend',
+        ))
+
+
+# ----- Incremental CrimeStat counters, daily rollup and heatmap -----
+
+def _apply(deltas):
+    """`deltas` is a list of (created_at, geohash, category, status, step)."""
+    counters.apply_deltas((category, status, step) for _, _, category, status, step in deltas)
+    rollups.apply_deltas(
+        (rollups.report_day(created_at), category, status, step)
+        for created_at, _, category, status, step in deltas
+    )
+    heatmap.apply_deltas(
+        (rollups.report_day(created_at), geohash, category, status, step)
+        for created_at, geohash, category, status, step in deltas
+    )
+
+
+@receiver(post_save, sender=Report)
+def count_saved_report(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        _apply([(instance.created_at, instance.geohash, instance.category, instance.status, 1)])
+        return
+
+    # Report.save() records the state the instance was loaded with.
+    previous = getattr(instance, 'previous_state', None)
+    current = (instance.geohash, instance.category, instance.status)
+    if previous and (previous['geohash'], previous['category'], previous['status']) != current:
+        _apply([
+            (instance.created_at, previous['geohash'], previous['category'], previous['status'], -1),
+            (instance.created_at, *current, 1),
+        ])
+
+
+@receiver(post_delete, sender=Report)
+def count_deleted_report(sender, instance, **kwargs):
+    _apply([(instance.created_at, instance.geohash, instance.category, instance.status, -1)])
+
 
-        # Send notification to each user
-        for user in users_to_notify:
-            Notification.objects.create(
-                recipient=user,
-                message=message,
-                notification_type='crime_trend'
-            )
+@receiver(reports_created)
+def count_bulk_created_reports(sender, reports, **kwargs):
+    _apply([(report.created_at, report.geohash, report.category, report.status, 1) for report in reports])
+
+
+@receiver(report_status_changed)
+def count_status_changes(sender, changes, saved=False, **kwargs):
+    if saved:
+        return  # Counted by count_saved_report.
+    deltas = []
+    for change in changes:
+        moved = (change['created_at'], change['geohash'], change['category'])
+        deltas.append((*moved, change['old_status'], -1))
+        deltas.append((*moved, change['new_status'], 1))
+    _apply(deltas)
+
+
+# ----- Snapshot tombstones -----
+
+@receiver(post_delete, sender=Report)
+def record_report_tombstone(sender, instance, **kwargs):
+    ReportTombstone.objects.create(report_id=instance.pk)
+
+
+# ----- Response cache invalidation -----
+
+@receiver(post_save, sender=CrimeStat)
+@receiver(post_delete, sender=CrimeStat)
+def invalidate_crimestat_responses(sender, **kwargs):
+    bump_version('crimestats')
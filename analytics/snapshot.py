@@ -0,0 +1,254 @@
+"""
+Immutable columnar snapshots of the Report table for analytics.
+
+`manage.py snapshot_reports` writes one flat .npy file per column into a new
+directory and then atomically repoints REPORT_SNAPSHOT_DIR/CURRENT at it.
+Readers memory-map the columns (`np.load(mmap_mode='r')`), so every worker
+process shares the same pages through the OS page cache instead of holding
+its own copy.
+
+A snapshot goes stale as reports change. `current_columns()` merges in only
+the rows updated since it was taken (by the indexed `updated_at`) and drops
+the ones deleted since (by the ReportTombstone rows written on delete),
+giving the present state without rescanning history. Code that changes
+reports with QuerySet.update() must also set `updated_at`, as the bulk
+status update does.
+
+Off-choice statuses and categories share one code each in the snapshot, so
+a filter naming such a value is answered from SQL instead (see `covers`).
+"""
+import json
+import math
+import os
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from reports.aggregation import CATEGORIES, STATUSES
+from reports.filters import BBOX_PARAMS, parse_moment
+from reports.models import Report
+from .models import ReportTombstone
+from .timeseries import GROUPS, Epoch, fetch_columns, group_code
+
+COLUMNS = {
+    'id': np.int64,
+    'created_at': np.int64,  # epoch seconds
+    'category': np.uint8,    # index into CATEGORY_CODES
+    'status': np.uint8,      # index into STATUS_CODES, UNKNOWN_CODE otherwise
+    'latitude': np.float32,
+    'longitude': np.float32,
+    'user_id': np.int64,
+}
+CATEGORY_CODES = GROUPS['category']
+STATUS_CODES = GROUPS['status']
+UNKNOWN_CODE = 255
+
+# Rows updated this long before the snapshot started are merged in again, so
+# transactions that committed while it was being written are not missed.
+DELTA_OVERLAP = timedelta(minutes=5)
+
+CURRENT_FILE = 'CURRENT'
+MANIFEST_FILE = 'manifest.json'
+
+
+def snapshot_root():
+    return Path(getattr(settings, 'REPORT_SNAPSHOT_DIR', Path(settings.BASE_DIR) / 'snapshots'))
+
+
+def _rows(queryset):
+    """`queryset` as a dict of COLUMNS arrays, sorted by id."""
+    # Unordered in SQL so the planner can use the filter's index; sorted below.
+    rows = queryset.order_by().annotate(
+        epoch=Epoch('created_at'),
+        category_code=group_code('category', CATEGORY_CODES),
+        status_code=group_code('status', STATUS_CODES, default=UNKNOWN_CODE),
+    ).values_list('id', 'epoch', 'category_code', 'status_code', 'latitude', 'longitude', 'user_id')
+    # float64 holds every value of these columns exactly.
+    matrix = fetch_columns(rows, width=len(COLUMNS), dtype=np.float64)
+    matrix = matrix[np.argsort(matrix[:, 0], kind='stable')]
+    return {name: matrix[:, index].astype(dtype) for index, (name, dtype) in enumerate(COLUMNS.items())}
+
+
+class ReportSnapshot:
+    def __init__(self, path, manifest, columns):
+        self.path = path
+        self.manifest = manifest
+        self.columns = columns
+        self.taken_at = datetime.fromisoformat(manifest['taken_at'])
+
+    def __len__(self):
+        return self.manifest['rows']
+
+    @classmethod
+    def open(cls, path):
+        manifest = json.loads((path / MANIFEST_FILE).read_text())
+        columns = {name: np.load(path / f'{name}.npy', mmap_mode='r') for name in COLUMNS}
+        return cls(path, manifest, columns)
+
+    def is_compatible(self):
+        """False if the category/status codes no longer match the model choices."""
+        return (
+            self.manifest.get('categories') == CATEGORY_CODES
+            and self.manifest.get('statuses') == STATUS_CODES
+        )
+
+
+def write_snapshot(root=None, keep=None):
+    """Write a new snapshot, make it current and prune old ones. Returns it."""
+    root = Path(root) if root is not None else snapshot_root()
+    keep = keep if keep is not None else getattr(settings, 'REPORT_SNAPSHOT_KEEP', 2)
+    root.mkdir(parents=True, exist_ok=True)
+
+    taken_at = timezone.now()
+    columns = _rows(Report.objects.all())
+
+    name = taken_at.strftime('%Y%m%dT%H%M%S%f')
+    staging = root / f'.tmp-{name}'
+    staging.mkdir()
+    for column, values in columns.items():
+        np.save(staging / f'{column}.npy', values)
+    (staging / MANIFEST_FILE).write_text(json.dumps({
+        'taken_at': taken_at.isoformat(),
+        'rows': len(columns['id']),
+        'max_id': int(columns['id'][-1]) if len(columns['id']) else 0,
+        'categories': CATEGORY_CODES,
+        'statuses': STATUS_CODES,
+    }))
+    os.rename(staging, root / name)
+
+    pointer = root / f'.{CURRENT_FILE}.tmp'
+    pointer.write_text(name)
+    os.replace(pointer, root / CURRENT_FILE)
+
+    # Processes that still map a pruned snapshot keep reading it: the files
+    # stay alive until they are unmapped.
+    snapshots = sorted(path for path in root.iterdir() if path.is_dir() and not path.name.startswith('.'))
+    for old in snapshots[:-keep] if keep > 0 else []:
+        if old.name != name:
+            shutil.rmtree(old, ignore_errors=True)
+
+    # Tombstones older than every retained snapshot are no longer read.
+    oldest = min(
+        (ReportSnapshot.open(path).taken_at for path in snapshots if path.exists()),
+        default=taken_at,
+    )
+    ReportTombstone.objects.filter(deleted_at__lt=oldest - DELTA_OVERLAP).delete()
+    return ReportSnapshot.open(root / name)
+
+
+_loaded = {'path': None, 'snapshot': None}
+
+
+def load_snapshot(root=None):
+    """The current snapshot (memory-mapped once per process), or None."""
+    root = Path(root) if root is not None else snapshot_root()
+    try:
+        path = root / (root / CURRENT_FILE).read_text().strip()
+    except FileNotFoundError:
+        return None
+    if _loaded['path'] != path:
+        try:
+            snapshot = ReportSnapshot.open(path)
+        except FileNotFoundError:
+            return None
+        _loaded.update(path=path, snapshot=snapshot)
+    snapshot = _loaded['snapshot']
+    return snapshot if snapshot.is_compatible() else None
+
+
+def current_columns(snapshot):
+    """
+    The snapshot columns merged with the reports changed since it was taken:
+    updated rows replace their snapshot version and deleted rows are
+    dropped. Returns the memory-mapped arrays themselves when nothing
+    changed.
+    """
+    columns = snapshot.columns
+    ids = columns['id']
+    since = snapshot.taken_at - DELTA_OVERLAP
+    delta = _rows(Report.objects.filter(updated_at__gte=since))
+    deleted = np.fromiter(
+        ReportTombstone.objects.filter(deleted_at__gte=since).values_list('report_id', flat=True),
+        dtype=np.int64,
+    )
+
+    # Snapshot rows that were updated (superseded by the delta) or deleted.
+    stale = np.concatenate((delta['id'], deleted))
+    keep = None
+    if len(stale):
+        positions = np.searchsorted(ids, stale)
+        found = positions < len(ids)
+        found[found] = ids[positions[found]] == stale[found]
+        if found.any():
+            keep = np.ones(len(ids), dtype=bool)
+            keep[positions[found]] = False
+
+    if keep is None and not len(delta['id']):
+        return columns
+    return {
+        name: np.concatenate((values if keep is None else values[keep], delta[name]))
+        for name, values in columns.items()
+    }
+
+
+def covers(params):
+    """
+    Whether `filter_mask` can express the status and category filters in
+    `params`: values outside the model choices are only matched in SQL.
+    """
+    def split(value):
+        return [item for item in value.split(',') if item]
+
+    return (
+        set(split(params.get('status') or '')) <= set(STATUSES)
+        and set(split(params.get('category') or '')) <= set(CATEGORIES)
+    )
+
+
+def filter_mask(columns, params):
+    """
+    Boolean mask over `columns` equivalent to reports.filters.filter_reports
+    (status, category, user, created_after, created_before, bounding box),
+    to the second and to float32 coordinates, for the params it `covers`.
+    Returns None when no filter applies.
+    """
+    mask = None
+
+    def narrow(condition):
+        nonlocal mask
+        mask = condition if mask is None else mask & condition
+
+    def split(value):
+        return [item for item in value.split(',') if item]
+
+    if params.get('status'):
+        codes = [STATUS_CODES.index(item) for item in split(params['status']) if item in STATUS_CODES]
+        narrow(np.isin(columns['status'], codes))
+    if params.get('category'):
+        codes = [CATEGORY_CODES.index(item) for item in split(params['category']) if item in CATEGORY_CODES]
+        narrow(np.isin(columns['category'], codes))
+    if params.get('user'):
+        try:
+            users = [int(item) for item in split(params['user'])]
+        except ValueError:
+            raise ValidationError({'user': f"Expected comma separated ids, got {params['user']!r}"})
+        narrow(np.isin(columns['user_id'], users))
+    if params.get('created_after'):
+        narrow(columns['created_at'] >= math.floor(parse_moment('created_after', params['created_after']).timestamp()))
+    if params.get('created_before'):
+        narrow(columns['created_at'] < math.ceil(parse_moment('created_before', params['created_before']).timestamp()))
+
+    bbox = [params.get(key) for key in BBOX_PARAMS]
+    if any(bbox):
+        try:
+            min_lat, min_lon, max_lat, max_lon = (float(value) for value in bbox)
+        except (TypeError, ValueError):
+            raise ValidationError({"bbox": f"{', '.join(BBOX_PARAMS)} must all be given as numbers."})
+        latitude, longitude = columns['latitude'], columns['longitude']
+        narrow((latitude >= min_lat) & (latitude <= max_lat) & (longitude >= min_lon) & (longitude <= max_lon))
+    return mask
@@ -1,15 +1,62 @@
 # analytics/tasks.py
 
-from .models import CrimeStat
-from notifications.models import Notification
-from django.utils.timezone import now, timedelta
-
-def check_crime_spike():
-    recent = CrimeStat.objects.filter(start_date__gte=now() - timedelta(days=1))
-    for stat in recent:
-        if stat.total_reports > 50:  # Example threshold
-            Notification.objects.create(
-                recipient_role='admin',
-                message=f"Alert: Spike in {stat.incident_type} reports!",
-                notification_type='crime_trend'
+from django.db import transaction
+from django.utils.timezone import now
+
+from .models import SpikeAlert
+from .spikes import SpikeDetector
+from notifications.broadcasts import broadcast
+from reports.models import Report
+
+
+def report_rows(since, until):
+    """(created_at, category, geohash) of reports in [since, until), oldest first."""
+    return (
+        Report.objects.filter(created_at__gte=since, created_at__lt=until)
+        .order_by('created_at', 'id')
+        .values_list('created_at', 'category', 'geohash')
+        .iterator(chunk_size=5000)
+    )
+
+
+def spike_message(spike):
+    area = f"{spike.label} reports" if spike.kind == 'category' else f"reports in area {spike.label}"
+    return (
+        f"Alert: Spike in {area}: {spike.observed} in the last window "
+        f"vs {spike.expected:.1f} expected (z={spike.z:.1f})."
+    )
+
+
+def check_crime_spike(detector=None, at=None):
+    """
+    Rebuild the sliding windows from recent reports and alert admins about
+    every key that is spiking now. Keys alerted within the cooldown (see
+    SpikeAlert) are skipped. Returns the spikes that were alerted.
+    """
+    detector = detector or SpikeDetector()
+    at = at or now()
+    detector.load(report_rows(at - detector.horizon, at))
+
+    recent_alerts = SpikeAlert.objects.filter(last_alerted_at__gt=at - detector.cooldown)
+    detector.last_alert = {
+        tuple(key.split(':', 1)): alerted_at
+        for key, alerted_at in recent_alerts.values_list('key', 'last_alerted_at')
+    }
+
+    spikes = detector.evaluate(at)
+    if not spikes:
+        return spikes
+
+    with transaction.atomic():
+        for spike in spikes:
+            SpikeAlert.objects.update_or_create(
+                key=spike.key,
+                defaults={
+                    'observed': spike.observed,
+                    'expected': spike.expected,
+                    'z_score': spike.z,
+                    'last_alerted_at': at,
+                },
             )
+            broadcast(['admin'], message=spike_message(spike), notification_type='crime_trend')
+    return spikes
@@ -0,0 +1,201 @@
+"""
+Report counts over time in hour, day, week or month buckets.
+
+The rows come back from one query as integer pairs (epoch seconds, group
+code), both computed in SQL, and are binned with NumPy: bucket edges are
+built in the current timezone (so DST and month lengths are respected),
+`searchsorted` maps every timestamp to its bucket and one `bincount` yields
+the zero-filled (group x bucket) matrix.
+"""
+import math
+from datetime import datetime, time, timedelta
+
+import numpy as np
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models import BigIntegerField, Case, Func, IntegerField, Value, When
+from django.utils import timezone
+
+from reports.aggregation import CATEGORIES, STATUSES, UNCATEGORIZED
+
+BUCKETS = ('hour', 'day', 'week', 'month')
+
+GROUPS = {
+    'category': CATEGORIES + [UNCATEGORIZED],
+    'status': STATUSES,
+}
+
+# Range used when the caller gives no start.
+DEFAULT_SPANS = {
+    'hour': timedelta(days=2),
+    'day': timedelta(days=30),
+    'week': timedelta(weeks=26),
+    'month': timedelta(days=365),
+}
+
+# Upper bound on buckets per response (a year of hours is 8760).
+MAX_BUCKETS = 10000
+
+FETCH_CHUNK_SIZE = 100000
+
+
+class Epoch(Func):
+    """Whole seconds since 1970-01-01 UTC of a datetime column."""
+    template = 'CAST(FLOOR(EXTRACT(EPOCH FROM %(expressions)s)) AS BIGINT)'
+    output_field = BigIntegerField()
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        # '%' is doubled twice: once for the template, once for the cursor
+        # wrapper's placeholder conversion.
+        return self.as_sql(
+            compiler, connection,
+            template="CAST(strftime('%%%%s', %(expressions)s) AS INTEGER)",
+            **extra_context,
+        )
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, template='UNIX_TIMESTAMP(%(expressions)s)', **extra_context)
+
+
+def floor_bucket(moment, bucket):
+    """Start of the bucket containing `moment`, in the current timezone."""
+    moment = timezone.localtime(moment)
+    if bucket == 'hour':
+        return moment.replace(minute=0, second=0, microsecond=0)
+    day = moment.date()
+    if bucket == 'week':
+        day -= timedelta(days=day.weekday())
+    elif bucket == 'month':
+        day = day.replace(day=1)
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _next_bucket(start, bucket):
+    if bucket == 'hour':
+        # Step in UTC so DST transitions neither skip nor repeat an hour.
+        return timezone.localtime(start + timedelta(hours=1))
+    day = start.date()
+    if bucket == 'day':
+        day += timedelta(days=1)
+    elif bucket == 'week':
+        day += timedelta(weeks=1)
+    else:
+        day = (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def bucket_end(moment, bucket):
+    """End of the bucket containing `moment` (the start of the next one)."""
+    return _next_bucket(floor_bucket(moment, bucket), bucket)
+
+
+def bucket_edges(start, end, bucket):
+    """
+    Bucket starts covering [start, end), plus the closing edge. Returns None
+    if that would be more than MAX_BUCKETS buckets.
+    """
+    edges = [floor_bucket(start, bucket)]
+    while edges[-1] < end:
+        if len(edges) > MAX_BUCKETS:
+            return None
+        edges.append(_next_bucket(edges[-1], bucket))
+    return edges
+
+
+def group_code(field, keys, default=None):
+    """SQL expression mapping `field` to its index in `keys` (unknown values -> `default`, else last)."""
+    return Case(
+        *[When(**{field: key}, then=Value(index)) for index, key in enumerate(keys)],
+        default=Value(len(keys) - 1 if default is None else default),
+        output_field=IntegerField(),
+    )
+
+
+def fetch_columns(queryset, width=2, dtype=np.int64):
+    """Run `queryset` (a values_list of `width` numbers) and return its rows as a `dtype` matrix."""
+    chunks = []
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        # A filter such as `id__in=[]` that can match nothing.
+        return np.empty((0, width), dtype=dtype)
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(FETCH_CHUNK_SIZE)
+            if not rows:
+                break
+            chunks.append(np.array(rows, dtype=dtype))
+    if not chunks:
+        return np.empty((0, width), dtype=dtype)
+    return np.concatenate(chunks)
+
+
+def bin_counts(epochs, codes, edges, groups):
+    """
+    (groups x buckets) matrix counting rows by group code and by the bucket
+    their epoch falls in. Every epoch must lie within [edges[0], edges[-1]).
+    """
+    buckets = len(edges) - 1
+    edge_epochs = np.array([int(edge.timestamp()) for edge in edges], dtype=np.int64)
+    bins = np.searchsorted(edge_epochs, epochs, side='right') - 1
+    return np.bincount(codes * buckets + bins, minlength=groups * buckets).reshape(groups, buckets)
+
+
+def report_timeseries(queryset, start, end, bucket='day', group_by=None):
+    """
+    Count the reports of `queryset` created in [start, end) per bucket,
+    optionally split by 'category' or 'status'.
+
+    Returns (edges, series): `edges` are the bucket starts and `series` maps
+    each group (or 'total') to a list of counts, one per bucket, zeros
+    included. Returns None if the range needs more than MAX_BUCKETS buckets.
+    """
+    edges = bucket_edges(start, end, bucket)
+    if edges is None:
+        return None
+    starts = edges[:-1]
+    keys = GROUPS[group_by] if group_by else ['total']
+
+    rows = queryset.filter(created_at__gte=start, created_at__lt=end).order_by()
+    if group_by == 'status':
+        # ReportSerializer only accepts STATUS_CHOICES; rows written before
+        # it did with any other status are not charted.
+        rows = rows.filter(status__in=keys)
+    if group_by:
+        rows = rows.annotate(group_code=group_code(group_by, keys))
+    else:
+        rows = rows.annotate(group_code=Value(0, output_field=IntegerField()))
+    rows = rows.annotate(epoch=Epoch('created_at')).values_list('epoch', 'group_code')
+    columns = fetch_columns(rows)
+
+    counts = bin_counts(columns[:, 0], columns[:, 1], edges, len(keys))
+    return starts, {key: counts[index].tolist() for index, key in enumerate(keys)}
+
+
+def columns_timeseries(columns, start, end, bucket='day', group_by=None, mask=None):
+    """
+    Same result as `report_timeseries`, computed from in-memory columns
+    (see analytics/snapshot.py) instead of a query. `mask` optionally
+    restricts the rows. Times are compared to the second.
+    """
+    edges = bucket_edges(start, end, bucket)
+    if edges is None:
+        return None
+    starts = edges[:-1]
+    keys = GROUPS[group_by] if group_by else ['total']
+
+    # Epochs are whole seconds: compare against the seconds that contain the bounds.
+    epochs = columns['created_at']
+    rows = (epochs >= math.floor(start.timestamp())) & (epochs < math.ceil(end.timestamp()))
+    if mask is not None:
+        rows &= mask
+    if group_by == 'status':
+        rows &= columns['status'] < len(keys)
+    if group_by:
+        codes = columns[group_by][rows].astype(np.int64)
+    else:
+        codes = np.zeros(int(rows.sum()), dtype=np.int64)
+
+    counts = bin_counts(epochs[rows], codes, edges, len(keys))
+    return starts, {key: counts[index].tolist() for index, key in enumerate(keys)}
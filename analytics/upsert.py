@@ -0,0 +1,70 @@
+"""
+Adding signed deltas to count tables in one statement.
+
+The daily rollup and the heatmap cells are `(key columns..., count)` tables
+with a unique key. `add_counts` writes a whole batch of deltas as one
+multi-row `INSERT ... ON CONFLICT (key) DO UPDATE SET count =
+GREATEST(count + EXCLUDED.count, 0)` (PostgreSQL and SQLite 3.24+), instead
+of an UPDATE (and maybe an INSERT) per key.
+
+The inserted row must pass the count's CHECK (>= 0) even when it only
+conflicts, so decrements go in a second statement that carries their size
+and subtracts it. They only touch existing rows: a missing row already
+counts as zero.
+
+`set_counts` is the same statement with `SET count = EXCLUDED.count`, for
+rebuilds: it overwrites rows in place, so it never collides with the
+upserts of concurrent report writes the way delete-then-insert does.
+"""
+from django.db import connections, router
+
+# Rows per statement: keeps the parameter count well under SQLite's limit.
+BATCH_SIZE = 500
+
+
+def add_counts(model, key_fields, per_key):
+    """Add `per_key[key]` to the `count` of the `model` row with that key, creating missing rows."""
+    increments = [(*key, step) for key, step in sorted(per_key.items()) if step > 0]
+    decrements = [(*key, -step) for key, step in sorted(per_key.items()) if step < 0]
+    _upsert(model, key_fields, increments, sign='+')
+    _upsert(model, key_fields, decrements, sign='-', existing=True)
+
+
+def set_counts(model, key_fields, per_key):
+    """Set the `count` of the `model` row with each key to `per_key[key]`, creating missing rows."""
+    _upsert(model, key_fields, [(*key, value) for key, value in sorted(per_key.items())])
+
+
+def _upsert(model, key_fields, rows, sign=None, existing=False):
+    """
+    Write `rows` of (*key, count) with `INSERT ... ON CONFLICT (key) DO UPDATE`.
+    With a `sign`, the count is added to ('+') or subtracted from ('-') the
+    stored one, floored at zero; without, it replaces it. With `existing`,
+    missing keys are skipped.
+    """
+    if not rows:
+        return
+
+    connection = connections[router.db_for_write(model)]
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    keys = [quote(model._meta.get_field(name).column) for name in key_fields]
+    count = quote(model._meta.get_field('count').column)
+    values = [f'v.column{index}' for index in range(1, len(keys) + 2)]
+    greatest = 'MAX' if connection.vendor == 'sqlite' else 'GREATEST'
+    exists = ' AND '.join(f'e.{key} = {value}' for key, value in zip(keys, values))
+    condition = f'EXISTS (SELECT 1 FROM {table} AS e WHERE {exists})' if existing else 'TRUE'
+    assignment = f'EXCLUDED.{count}' if sign is None else f'{greatest}({table}.{count} {sign} EXCLUDED.{count}, 0)'
+    row_placeholder = '(' + ', '.join(['%s'] * len(values)) + ')'
+
+    with connection.cursor() as cursor:
+        # Sorted keys: concurrent writers lock the rows in the same order.
+        for start in range(0, len(rows), BATCH_SIZE):
+            batch = rows[start:start + BATCH_SIZE]
+            cursor.execute(
+                f"INSERT INTO {table} ({', '.join(keys)}, {count}) "
+                f"SELECT {', '.join(values)} FROM (VALUES {', '.join([row_placeholder] * len(batch))}) AS v "
+                f"WHERE {condition} "
+                f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {count} = {assignment}",
+                [value for row in batch for value in row],
+            )
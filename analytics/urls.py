@@ -1,5 +1,12 @@
 from django.urls import path
-from .views import CrimeStatListView, reports_summary
+from .views import (
+    CrimeStatListView,
+    IncidentCounterListView,
+    reports_heatmap,
+    reports_resolution_time,
+    reports_summary,
+    reports_timeseries,
+)
 
 urlpatterns = [
     # Path to list crime statistics (RBAC applied here)
@@ -7,5 +14,9 @@ urlpatterns = [
     
     # Path for the reports summary (based on user role)
     path('reports/summary/', reports_summary, name='reports-summary'),
+    path('reports/heatmap/', reports_heatmap, name='reports-heatmap'),
+    path('reports/timeseries/', reports_timeseries, name='reports-timeseries'),
+    path('reports/resolution-time/', reports_resolution_time, name='reports-resolution-time'),
     path('crimestats/', CrimeStatListView.as_view(), name='crime-stats'),
+    path('incident-counters/', IncidentCounterListView.as_view(), name='incident-counters'),
 ]
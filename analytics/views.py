@@ -1,14 +1,20 @@
-from django.db.models import Count
-from django.db.models.functions import TruncDate
-from django.utils.timezone import now, timedelta
+from django.utils.dateparse import parse_date
+from django.utils.decorators import method_decorator
+from django.utils.timezone import localdate, now, timedelta
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
+from reports import response_cache
+from reports.filters import BBOX_PARAMS, filter_reports, parse_moment
 from reports.models import Report
-from .models import CrimeStat
-from .serializers import CrimeStatSerializer
+from reports.aggregation import summarize
+from reports.conditional import conditional_get, queryset_state
+from . import heatmap, resolution, snapshot, timeseries
+from .models import CrimeStat, IncidentCounter, ReportDailyRollup
+from .serializers import CrimeStatSerializer, IncidentCounterSerializer
 from rest_framework.permissions import BasePermission
+from django.http import JsonResponse
 
 
 # ======== Permissions ========
@@ -22,11 +28,25 @@ class IsAdmin(BasePermission):
         return request.user.is_authenticated and request.user.role == 'admin'
 
 
+# ======== Conditional GET validators ========
+def _crimestat_state(request, *args, **kwargs):
+    return queryset_state(CrimeStat.objects.all())
+
+
 # ======== CrimeStat List View (RBAC applied) ========
 class CrimeStatListView(generics.ListAPIView):
     serializer_class = CrimeStatSerializer
     permission_classes = [IsAuthenticated, IsAdminOrLawEnforcement]
 
+    @method_decorator(conditional_get(_crimestat_state))
+    def get(self, request, *args, **kwargs):
+        data = response_cache.cached(
+            'crime-stat-list', ['crimestats'],
+            lambda: list(self.get_serializer(self.get_queryset(), many=True).data),
+            vary=(request.user.role,),
+        )
+        return Response(data)
+
     def get_queryset(self):
         user_role = self.request.user.role
 
@@ -38,67 +58,201 @@ class CrimeStatListView(generics.ListAPIView):
         return CrimeStat.objects.none()  # Safety fallback
 
 
+# ======== Incident Counters View ========
+class IncidentCounterListView(generics.ListAPIView):
+    """Live per-incident-type report counts (one row per type, see analytics/counters.py)."""
+    serializer_class = IncidentCounterSerializer
+    permission_classes = [IsAuthenticated, IsAdminOrLawEnforcement]
+    queryset = IncidentCounter.objects.all()
+
+
 # ======== Summary Analytics View ========
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def reports_summary(request):
+    """
+    One aggregate query over the daily rollup; each role gets a projection of
+    it. The cost depends on the number of days covered, not on report volume.
+    """
     user_role = request.user.role
-    total_reports = Report.objects.count()
+    since = localdate(now() - timedelta(days=30)) if user_role == 'admin' else None
 
-    # === Admin Users ===
-    if user_role == 'admin':
-        reports_by_category = (
-            Report.objects.values('category')
-            .annotate(count=Count('id'))
-            .order_by('-count')
-        )
+    def compute():
+        return summarize(ReportDailyRollup.objects.all(), since=since, weight='count', day_field='day')
 
-        reports_by_status = (
-            Report.objects.values('status')
-            .annotate(count=Count('id'))
-            .order_by('-count')
-        )
+    # The admin view's 30-day window moves at midnight, hence `since` in the key.
+    summary = response_cache.cached('analytics-summary', ['reports'], compute, vary=(user_role, since))
 
-        last_30_days = now() - timedelta(days=30)
-        reports_over_time = (
-            Report.objects.filter(created_at__gte=last_30_days)
-            .annotate(day=TruncDate('created_at'))
-            .values('day')
-            .annotate(count=Count('id'))
-            .order_by('day')
-        )
+    # === Admin Users ===
+    if user_role == 'admin':
+        reports_by_status = summary.status_list()
+        reports_over_time = summary.day_list()
 
     # === Law Enforcement Users ===
     elif user_role == 'law_enforcement':
-        reports_by_category = (
-            Report.objects.values('category')
-            .annotate(count=Count('id'))
-            .order_by('-count')
-        )
-
         # Example: Show only active reports
-        reports_by_status = (
-            Report.objects.filter(status__in=['pending', 'in_progress'])
-            .values('status')
-            .annotate(count=Count('id'))
-        )
-
+        reports_by_status = summary.status_list(['pending', 'in_progress'])
         reports_over_time = []  # Not shown
 
     # === Citizen Users ===
     else:
-        reports_by_category = (
-            Report.objects.values('category')
-            .annotate(count=Count('id'))
-            .order_by('-count')
-        )
-
         reports_by_status = []  # Not shown
         reports_over_time = []  # Not shown
 
     return Response({
-        "total_reports": total_reports,
-        "reports_by_category": list(reports_by_category),
-        "reports_by_status": list(reports_by_status),
-        "reports_over_time": list(reports_over_time),
+        "total_reports": summary.total,
+        "reports_by_category": summary.category_list(),
+        "reports_by_status": reports_by_status,
+        "reports_over_time": reports_over_time,
+    })
+
+
+# ======== Heatmap Tiles ========
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def reports_heatmap(request):
+    """
+    Report counts per grid cell inside `min_lat`, `min_lon`, `max_lat`,
+    `max_lon` at `zoom` (city, district or street), optionally narrowed by
+    comma separated `category` / `status` and by `created_after` (inclusive)
+    / `created_before` (exclusive) dates. Served from the precomputed cells.
+    """
+    params = request.query_params
+    zoom = params.get('zoom', 'city')
+    if zoom not in heatmap.ZOOM_PRECISIONS:
+        return JsonResponse({"error": f"zoom must be one of: {', '.join(heatmap.ZOOM_PRECISIONS)}"}, status=400)
+    precision = heatmap.ZOOM_PRECISIONS[zoom]
+
+    try:
+        min_lat, min_lon, max_lat, max_lon = (float(params[key]) for key in BBOX_PARAMS)
+    except (KeyError, ValueError):
+        return JsonResponse({"error": f"{', '.join(BBOX_PARAMS)} must all be given as numbers."}, status=400)
+    if min_lat > max_lat or min_lon > max_lon:
+        return JsonResponse({"error": "The bounding box is empty."}, status=400)
+    if heatmap.tile_cell_count(min_lat, min_lon, max_lat, max_lon, precision) > heatmap.MAX_TILE_CELLS:
+        return JsonResponse({"error": "Bounding box too large for this zoom; use a coarser zoom."}, status=400)
+
+    days = {}
+    for name in ('created_after', 'created_before'):
+        if params.get(name):
+            days[name] = parse_date(params[name])
+            if days[name] is None:
+                return JsonResponse({"error": f"{name} must be a date (YYYY-MM-DD)."}, status=400)
+
+    categories = [item for item in params.get('category', '').split(',') if item]
+    statuses = [item for item in params.get('status', '').split(',') if item]
+
+    def compute():
+        return heatmap.tile(
+            min_lat, min_lon, max_lat, max_lon, precision,
+            categories=categories, statuses=statuses,
+            since=days.get('created_after'), until=days.get('created_before'),
+        )
+
+    vary = (zoom, min_lat, min_lon, max_lat, max_lon, sorted(categories), sorted(statuses), days)
+    cells = response_cache.cached('reports-heatmap', ['reports'], compute, vary=vary)
+    return Response({
+        "zoom": zoom,
+        "precision": precision,
+        "total": sum(cell['count'] for cell in cells),
+        "cells": cells,
+    })
+
+
+# ======== Time Series ========
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdminOrLawEnforcement])
+def reports_timeseries(request):
+    """
+    Report counts per `bucket` (hour, day, week or month) between `start`
+    (inclusive) and `end` (exclusive, default the end of the current bucket), zero-filled, optionally
+    split by `group_by` (category or status). The usual report filters
+    (status, category, user, bounding box) narrow the counted reports.
+    """
+    params = request.query_params
+    bucket = params.get('bucket', 'day')
+    if bucket not in timeseries.BUCKETS:
+        return JsonResponse({"error": f"bucket must be one of: {', '.join(timeseries.BUCKETS)}"}, status=400)
+    group_by = params.get('group_by') or None
+    if group_by is not None and group_by not in timeseries.GROUPS:
+        return JsonResponse({"error": f"group_by must be one of: {', '.join(timeseries.GROUPS)}"}, status=400)
+
+    # The default end is the close of the current bucket rather than now():
+    # it covers the same buckets and keeps the cache key stable until the
+    # bucket rolls over.
+    end = parse_moment('end', params['end']) if params.get('end') else timeseries.bucket_end(now(), bucket)
+    start = parse_moment('start', params['start']) if params.get('start') else end - timeseries.DEFAULT_SPANS[bucket]
+    if start >= end:
+        return JsonResponse({"error": "start must be before end."}, status=400)
+
+    reports = filter_reports(Report.objects.all(), params)
+
+    def compute():
+        # Scan the memory-mapped snapshot plus recent changes when one exists
+        # and can express the filters.
+        current = snapshot.load_snapshot()
+        if current is not None and snapshot.covers(params):
+            columns = snapshot.current_columns(current)
+            return timeseries.columns_timeseries(
+                columns, start, end, bucket=bucket, group_by=group_by,
+                mask=snapshot.filter_mask(columns, params),
+            )
+        return timeseries.report_timeseries(reports, start, end, bucket=bucket, group_by=group_by)
+
+    vary = (bucket, group_by, start.isoformat(), end.isoformat(), sorted(params.items()))
+    result = response_cache.cached('reports-timeseries', ['reports'], compute, vary=vary)
+    if result is None:
+        return JsonResponse({
+            "error": f"At most {timeseries.MAX_BUCKETS} buckets per request; use a larger bucket or a shorter range."
+        }, status=400)
+
+    starts, series = result
+    return Response({
+        "bucket": bucket,
+        "group_by": group_by,
+        "start": start,
+        "end": end,
+        "buckets": starts,
+        "series": series,
+    })
+
+
+# ======== Time to Resolution ========
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdminOrLawEnforcement])
+def reports_resolution_time(request):
+    """
+    Median and p90 hours from creation to resolution, per category and
+    `bucket` (hour, day, week or month, by resolution time), between `start` and
+    `end` (default: the last year). Optional comma separated `category`.
+    """
+    params = request.query_params
+    bucket = params.get('bucket', 'month')
+    if bucket not in timeseries.BUCKETS:
+        return JsonResponse({"error": f"bucket must be one of: {', '.join(timeseries.BUCKETS)}"}, status=400)
+
+    # End of the current bucket, not now(): see reports_timeseries.
+    end = parse_moment('end', params['end']) if params.get('end') else timeseries.bucket_end(now(), bucket)
+    start = parse_moment('start', params['start']) if params.get('start') else end - timeseries.DEFAULT_SPANS[bucket]
+    if start >= end:
+        return JsonResponse({"error": "start must be before end."}, status=400)
+    categories = [item for item in params.get('category', '').split(',') if item]
+
+    def compute():
+        return resolution.resolution_times(start, end, bucket=bucket, categories=categories)
+
+    vary = (bucket, start.isoformat(), end.isoformat(), sorted(categories))
+    result = response_cache.cached('reports-resolution-time', ['reports'], compute, vary=vary)
+    if result is None:
+        return JsonResponse({
+            "error": f"At most {timeseries.MAX_BUCKETS} buckets per request; use a larger bucket or a shorter range."
+        }, status=400)
+
+    starts, series = result
+    return Response({
+        "bucket": bucket,
+        "start": start,
+        "end": end,
+        "buckets": starts,
+        "series": series,
     })
@@ -3,6 +3,21 @@ ASGI config for crime_reporting project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+This entry point serves only the notification event stream
+(/api/notifications/stream/), whose connections are held as asyncio tasks.
+Every other route, the API and the report exports included, is served by the
+WSGI application (wsgi.py): under ASGI, Django reads synchronous streaming
+responses fully into memory, which would buffer whole exports. Run both and
+route the stream path to this process, e.g.:
+
+    gunicorn crime_reporting.wsgi:application --bind :8000
+    gunicorn crime_reporting.asgi:application -k uvicorn.workers.UvicornWorker --bind :8001
+
+with the proxy sending /api/notifications/stream/ to :8001 (buffering off)
+and everything else to :8000. In development, run `manage.py runserver` and
+`uvicorn crime_reporting.asgi:application --port 8001`, and point the
+frontend's REACT_APP_STREAM_URL at http://localhost:8001/api.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 """
@@ -13,4 +28,22 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'crime_reporting.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from django.urls import reverse  # noqa: E402  (needs the app registry loaded above)
+
+STREAM_PATH = reverse('notification-stream')
+
+NOT_SERVED = b'{"error": "Only the notification stream is served here."}'
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'http' and scope['path'] != STREAM_PATH:
+        await send({
+            'type': 'http.response.start',
+            'status': 404,
+            'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(NOT_SERVED)).encode())],
+        })
+        await send({'type': 'http.response.body', 'body': NOT_SERVED})
+        return
+    await django_application(scope, receive, send)
@@ -111,6 +111,33 @@ REST_FRAMEWORK = {
     ),
 }
 
+# Report list pagination (keyset / cursor based)
+REPORTS_PAGE_SIZE = 50
+REPORTS_MAX_PAGE_SIZE = 500
+
+# Rows fetched per database round trip when streaming report exports
+REPORTS_EXPORT_CHUNK_SIZE = 2000
+
+# Bulk report submission limits
+REPORTS_BULK_MAX_ITEMS = 5000
+REPORTS_BULK_CHUNK_SIZE = 500
+
+# Versioned response cache for summary endpoints (reports/response_cache.py).
+# Point RESPONSE_CACHE_ALIAS at a shared backend when running several workers.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+RESPONSE_CACHE_ALIAS = 'default'
+RESPONSE_CACHE_TIMEOUT = 24 * 60 * 60
+RESPONSE_CACHE_LOCK_TIMEOUT = 10
+
+# Memory-mapped columnar report snapshots for analytics (analytics/snapshot.py),
+# written by `manage.py snapshot_reports`. Older snapshots beyond KEEP are pruned.
+REPORT_SNAPSHOT_DIR = BASE_DIR / 'snapshots'
+REPORT_SNAPSHOT_KEEP = 2
+
 # JWT Authentication configuration
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
@@ -139,5 +166,8 @@ CORS_ALLOW_HEADERS = [
     'x-csrf-token',
 ]
 
+# Report lists return their next / previous page URLs in the Link header
+CORS_EXPOSE_HEADERS = ['Link']
+
 # Automatically append slashes to URL paths for consistent routing
 APPEND_SLASH = True
@@ -3,6 +3,9 @@ WSGI config for crime_reporting project.
 
 It exposes the WSGI callable as a module-level variable named ``application``.
 
+Serves the whole API except the notification event stream, which runs from
+the ASGI application (see asgi.py for the deployment split).
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/wsgi/
 """
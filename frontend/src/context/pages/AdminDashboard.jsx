@@ -2,6 +2,7 @@ import React, { useEffect, useState } from "react";
 import { useAuth } from "../../context/AuthContext";
 import { useNavigate } from "react-router-dom";
 import axiosInstance from "../../axios";
+import { pageLinks } from "../../utils/pagination";
 import backgroundImage from "../../assets/utumishi.png";
 
 const AdminDashboard = () => {
@@ -10,10 +11,12 @@ const AdminDashboard = () => {
   const [users, setUsers] = useState([]);
   const [reports, setReports] = useState([]);
   const [userPage, setUserPage] = useState(1);
-  const [reportPage, setReportPage] = useState(1);
   const [refreshTrigger, setRefreshTrigger] = useState(false); // 🔁 Refresh trigger
   const usersPerPage = 10;
   const reportsPerPage = 10;
+  // Reports are cursor paginated: follow the server's next / prev links
+  const [reportPageUrl, setReportPageUrl] = useState(`/reports/all/?page_size=${reportsPerPage}`);
+  const [reportLinks, setReportLinks] = useState({ next: null, prev: null });
 
   useEffect(() => {
     if (!user || user.role !== "admin") {
@@ -25,9 +28,10 @@ const AdminDashboard = () => {
     const fetchData = async () => {
       try {
         const usersRes = await axiosInstance.get(`/users/?page=${userPage}&page_size=${usersPerPage}`);
-        const reportsRes = await axiosInstance.get(`/reports/all/?page=${reportPage}&page_size=${reportsPerPage}`);
+        const reportsRes = await axiosInstance.get(reportPageUrl);
         setUsers(usersRes.data);
         setReports(reportsRes.data);
+        setReportLinks(pageLinks(reportsRes));
       } catch (err) {
         console.error(err);
         alert("Error loading data.");
@@ -35,7 +39,7 @@ const AdminDashboard = () => {
     };
 
     fetchData();
-  }, [user, userPage, reportPage, refreshTrigger, navigate]); // ⬅️ Added refreshTrigger
+  }, [user, userPage, reportPageUrl, refreshTrigger, navigate]); // ⬅️ Added refreshTrigger
 
   const handleRoleChange = async (userId, action) => {
     const newRole = action === "approve" ? "law_enforcement" : "citizen";
@@ -71,16 +75,18 @@ const AdminDashboard = () => {
   const getStatusColor = (status) => {
     switch (status) {
       case "pending": return "orange";
-      case "reviewed": return "blue";
+      case "in_progress": return "blue";
       case "resolved": return "green";
+      case "rejected": return "red";
       default: return "black";
     }
   };
 
-  const statusOptions = ["pending", "reviewed", "resolved"];
+  const statusOptions = ["pending", "in_progress", "resolved", "rejected"];
 
   const handleNextUsers = () => setUserPage((prev) => prev + 1);
-  const handleNextReports = () => setReportPage((prev) => prev + 1);
+  const handlePrevReports = () => reportLinks.prev && setReportPageUrl(reportLinks.prev);
+  const handleNextReports = () => reportLinks.next && setReportPageUrl(reportLinks.next);
 
   return (
     <div style={styles.container}>
@@ -188,7 +194,7 @@ const AdminDashboard = () => {
                           .filter((status) => status !== r.status)
                           .map((status) => (
                             <option key={status} value={status}>
-                              {status.charAt(0).toUpperCase() + status.slice(1)}
+                              {status.charAt(0).toUpperCase() + status.slice(1).replace("_", " ")}
                             </option>
                           ))}
                       </select>
@@ -198,7 +204,10 @@ const AdminDashboard = () => {
               </tbody>
             </table>
           </div>
-          <button onClick={handleNextReports} style={styles.nextButton}>Next</button>
+          {reportLinks.prev && (
+            <button onClick={handlePrevReports} style={styles.nextButton}>Previous</button>
+          )}
+          <button onClick={handleNextReports} style={styles.nextButton} disabled={!reportLinks.next}>Next</button>
         </div>
       </div>
     </div>
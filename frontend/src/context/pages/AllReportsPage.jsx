@@ -76,8 +76,9 @@ const AllReportsPage = () => {
 const getStatusClass = (status) => {
   switch (status) {
     case 'pending': return 'bg-yellow-100 text-yellow-800';
-    case 'reviewed': return 'bg-blue-100 text-blue-800';
+    case 'in_progress': return 'bg-blue-100 text-blue-800';
     case 'resolved': return 'bg-green-100 text-green-800';
+    case 'rejected': return 'bg-red-100 text-red-800';
     default: return 'bg-gray-100 text-gray-800';
   }
 };
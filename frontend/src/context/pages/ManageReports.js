@@ -2,6 +2,7 @@ import React, { useState, useEffect, useCallback } from "react";
 import { useAuth } from "../../context/AuthContext";
 import { useNavigate } from "react-router-dom";
 import axios from "../../axios";
+import { pageLinks } from "../../utils/pagination";
 import bgImage from "../../assets/badge-icon.png";
 
 const styles = {
@@ -129,15 +130,20 @@ const ManageReports = () => {
 
   const [currentPage, setCurrentPage] = useState(1);
   const reportsPerPage = 5;
+  // The server pages the list: keep the URL of the current page and the
+  // links to its neighbours.
+  const [pageUrl, setPageUrl] = useState(`/reports/all/?page_size=${reportsPerPage}`);
+  const [links, setLinks] = useState({ next: null, prev: null });
 
   const fetchReports = useCallback(async () => {
     try {
-      const response = await axios.get("/reports/all/");
+      const response = await axios.get(pageUrl);
       setReports(response.data);
+      setLinks(pageLinks(response));
     } catch (error) {
       setError("Failed to fetch reports. Please try again later.");
     }
-  }, []);
+  }, [pageUrl]);
 
   const fetchStatusChoices = useCallback(async () => {
     try {
@@ -181,17 +187,18 @@ const ManageReports = () => {
   };
 
   // Pagination logic
-  const totalPages = Math.ceil(reports.length / reportsPerPage);
-  const indexOfLast = currentPage * reportsPerPage;
-  const indexOfFirst = indexOfLast - reportsPerPage;
-  const currentReports = reports.slice(indexOfFirst, indexOfLast);
+  const currentReports = reports;
 
   const handlePrev = () => {
-    if (currentPage > 1) setCurrentPage((prev) => prev - 1);
+    if (!links.prev) return;
+    setPageUrl(links.prev);
+    setCurrentPage((prev) => prev - 1);
   };
 
   const handleNext = () => {
-    if (currentPage < totalPages) setCurrentPage((prev) => prev + 1);
+    if (!links.next) return;
+    setPageUrl(links.next);
+    setCurrentPage((prev) => prev + 1);
   };
 
   return (
@@ -252,28 +259,28 @@ const ManageReports = () => {
           <p>No reports available</p>
         )}
 
-        {totalPages > 1 && (
+        {(links.prev || links.next) && (
           <div style={styles.pagination}>
             <button
               onClick={handlePrev}
               style={{
                 ...styles.pageBtnPrev,
-                ...(currentPage === 1 && styles.pageBtnDisabled),
+                ...(!links.prev && styles.pageBtnDisabled),
               }}
-              disabled={currentPage === 1}
+              disabled={!links.prev}
             >
               Previous
             </button>
             <span>
-              Page {currentPage} of {totalPages}
+              Page {currentPage}
             </span>
             <button
               onClick={handleNext}
               style={{
                 ...styles.pageBtnNext,
-                ...(currentPage === totalPages && styles.pageBtnDisabled),
+                ...(!links.next && styles.pageBtnDisabled),
               }}
-              disabled={currentPage === totalPages}
+              disabled={!links.next}
             >
               Next
             </button>
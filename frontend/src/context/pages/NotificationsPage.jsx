@@ -27,6 +27,70 @@ const NotificationsPage = () => {
     fetchNotifications();
   }, [navigate]);
 
+  // Live updates: the server pushes new notifications instead of us polling.
+  // The stream is opened with a single-use ticket, so a dropped connection is
+  // reopened with a fresh one, resuming after the last event we saw.
+  useEffect(() => {
+    if (!localStorage.getItem('access_token')) return undefined;
+
+    const streamUrl = process.env.REACT_APP_STREAM_URL || axios.defaults.baseURL;
+    let source = null;
+    let retry = null;
+    let lastEventId = null;
+    let closed = false;
+
+    const connect = async () => {
+      let ticket;
+      try {
+        const res = await axios.post('/notifications/stream/ticket/');
+        ticket = res.data.ticket;
+      } catch (error) {
+        console.error('Could not open the notification stream', error);
+        if (!closed && error.response?.status !== 401) retry = setTimeout(connect, 5000);
+        return;
+      }
+      if (closed) return;
+
+      const params = new URLSearchParams({ ticket });
+      if (lastEventId) params.set('last_event_id', lastEventId);
+      source = new EventSource(`${streamUrl}/notifications/stream/?${params}`);
+
+      source.addEventListener('notification', (event) => {
+        lastEventId = event.lastEventId;
+        const data = JSON.parse(event.data);
+        const notification = {
+          ...data,
+          related_report: data.related_report ? { id: data.related_report } : null,
+        };
+        setNotifications((prev) =>
+          prev.some((n) => n.id === notification.id) ? prev : [notification, ...prev]
+        );
+      });
+      // Sent when we missed too much while disconnected: reload the list
+      source.addEventListener('resync', async (event) => {
+        lastEventId = event.lastEventId;
+        try {
+          const res = await axios.get('/notifications/');
+          setNotifications(res.data);
+        } catch (error) {
+          console.error('Error fetching notifications', error);
+        }
+      });
+      // The browser would retry with the used ticket: reconnect with a new one
+      source.onerror = () => {
+        source.close();
+        if (!closed) retry = setTimeout(connect, 3000);
+      };
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(retry);
+      if (source) source.close();
+    };
+  }, []);
+
   const handleMarkAsRead = async (id) => {
     try {
       await axios.patch(`/notifications/${id}/`, { is_read: true });
@@ -40,6 +104,20 @@ const NotificationsPage = () => {
     }
   };
 
+  // One request for everything on the page, however many alerts are unread
+  const handleMarkAllAsRead = async () => {
+    if (notifications.length === 0) return;
+    const newestId = Math.max(...notifications.map((n) => n.id));
+    try {
+      await axios.post('/notifications/mark-read/', { up_to_id: newestId });
+      setNotifications((prev) =>
+        prev.map((n) => (n.id <= newestId ? { ...n, is_read: true } : n))
+      );
+    } catch (error) {
+      console.error('Failed to mark notifications as read', error);
+    }
+  };
+
   const renderNotificationLink = (notification) => {
     if (notification.notification_type === 'crime_trend') {
       return (
@@ -112,6 +190,17 @@ const NotificationsPage = () => {
           Notifications
         </h1>
 
+        {notifications.some((n) => !n.is_read) && (
+          <div className="text-right mb-4">
+            <button
+              onClick={handleMarkAllAsRead}
+              className="text-blue-500 hover:underline text-sm"
+            >
+              Mark all as read
+            </button>
+          </div>
+        )}
+
         {notifications.length === 0 ? (
           <p className="text-center">No notifications to show.</p>
         ) : (
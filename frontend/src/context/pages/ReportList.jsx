@@ -9,8 +9,11 @@ const ReportList = () => {
   const [error, setError] = useState(null);
   const [loadingReports, setLoadingReports] = useState(true);
   const [activeMarker, setActiveMarker] = useState(null);
-  const [currentPage, setCurrentPage] = useState(1);
   const reportsPerPage = 4;
+  // The server pages the list: keep the URL of the current page and the
+  // next / previous page URLs it returned.
+  const [pageUrl, setPageUrl] = useState(`/reports/?page_size=${reportsPerPage}`);
+  const [links, setLinks] = useState({ next: null, previous: null });
 
   useEffect(() => {
     const fetchReports = async () => {
@@ -21,12 +24,13 @@ const ReportList = () => {
           return;
         }
 
-        const response = await axios.get("/reports/");
+        const response = await axios.get(pageUrl);
         console.log("Response data:", response.data);
         
         // Ensure only the reports array is set
         if (Array.isArray(response.data.reports)) {
           setReports(response.data.reports);
+          setLinks({ next: response.data.next, previous: response.data.previous });
         } else {
           setReports([]);
           setError("Invalid report data format received.");
@@ -48,7 +52,7 @@ const ReportList = () => {
     };
 
     fetchReports();
-  }, [user]);
+  }, [user, pageUrl]);
 
   const handleStatusUpdate = async (reportId) => {
     try {
@@ -78,12 +82,7 @@ const ReportList = () => {
     isFinite(lng);
 
   // Pagination Logic
-  const indexOfLastReport = currentPage * reportsPerPage;
-  const indexOfFirstReport = indexOfLastReport - reportsPerPage;
-  const currentReports = Array.isArray(reports)
-    ? reports.slice(indexOfFirstReport, indexOfLastReport)
-    : [];
-  const totalPages = Math.ceil(reports.length / reportsPerPage);
+  const currentReports = Array.isArray(reports) ? reports : [];
 
   return (
     <div style={{ padding: "1rem" }}>
@@ -186,16 +185,16 @@ const ReportList = () => {
 
           {/* Pagination */}
           <div style={{ textAlign: "center", marginTop: "1.5rem" }}>
-            {currentPage > 1 && (
+            {links.previous && (
               <button
-                onClick={() => setCurrentPage(currentPage - 1)}
+                onClick={() => setPageUrl(links.previous)}
                 style={{ marginRight: "10px" }}
               >
                 Previous
               </button>
             )}
-            {currentPage < totalPages && (
-              <button onClick={() => setCurrentPage(currentPage + 1)}>Next</button>
+            {links.next && (
+              <button onClick={() => setPageUrl(links.next)}>Next</button>
             )}
           </div>
         </>
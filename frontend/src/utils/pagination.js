@@ -0,0 +1,12 @@
+// Report lists are cursor paginated: the server returns the URLs of the
+// next and previous pages in the Link header (and, for /reports/, in the
+// body). Follow those instead of computing page numbers.
+export const pageLinks = (response) => {
+  const links = { next: null, prev: null };
+  const header = response.headers?.link || "";
+  header.split(",").forEach((part) => {
+    const match = part.match(/<([^>]+)>\s*;\s*rel="(next|prev)"/);
+    if (match) links[match[2]] = match[1];
+  });
+  return links;
+};
@@ -1,6 +1,13 @@
 from django.contrib import admin
-from .models import Notification
+from .models import Notification, NotificationReceipt
 
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
-    list_display = ('message', 'recipient', 'timestamp')  # Ensure fields exist in the model
+    list_display = ('message', 'recipient', 'recipient_role', 'timestamp')  # Ensure fields exist in the model
+
+
+@admin.register(NotificationReceipt)
+class NotificationReceiptAdmin(admin.ModelAdmin):
+    # Per-user read/dismissed state of role broadcasts
+    list_display = ('notification', 'user', 'is_read', 'is_dismissed', 'updated_at')
+    list_filter = ('is_read', 'is_dismissed')
@@ -0,0 +1,72 @@
+"""
+Role broadcasts: one notification row for every user of a role.
+
+A broadcast is stored once, with no recipient and `recipient_role` set, so
+sending it costs the same whatever the number of officers. Users of that
+role who joined before it was sent see it in their feed. Their read and
+dismissed state is kept in NotificationReceipt, which only has rows for
+users who acted on it.
+"""
+from django.db import transaction
+from django.db.models import F, FilteredRelation, Q
+from django.db.models.functions import Coalesce
+
+from . import counters
+from .models import Notification, NotificationReceipt
+from .signals import notifications_created
+
+
+def broadcast(roles, **fields):
+    """Send a notification with `fields` to every user having one of `roles`. Returns the rows."""
+    notifications = Notification.objects.bulk_create([Notification(recipient_role=role, **fields) for role in roles])
+    notifications_created.send(sender=Notification, notifications=notifications)
+    return notifications
+
+
+def broadcast_filter(user):
+    return Q(recipient__isnull=True, recipient_role=user.role, timestamp__gte=user.date_joined)
+
+
+def visible_filter(user):
+    """Direct notifications to `user` and the broadcasts they receive."""
+    return Q(recipient=user) | broadcast_filter(user)
+
+
+def with_receipt(queryset, user):
+    """Join `user`'s receipt (if any) as `receipt` and annotate their read state as `read_state`."""
+    return queryset.annotate(
+        receipt=FilteredRelation('receipts', condition=Q(receipts__user=user)),
+    ).annotate(read_state=Coalesce('receipt__is_read', 'is_read'))
+
+
+def user_feed(user):
+    """
+    `user`'s notifications, newest first, each annotated with `read_state`;
+    dismissed broadcasts are left out.
+
+    A UNION ALL of two scans of the (recipient, timestamp) and (role,
+    timestamp) indexes, merged in timestamp order by the database.
+    """
+    direct = Notification.objects.filter(recipient=user).order_by().annotate(read_state=F('is_read'))
+    broadcasts = (
+        with_receipt(Notification.objects.filter(broadcast_filter(user)), user)
+        .filter(Q(receipt__isnull=True) | Q(receipt__is_dismissed=False))
+        .order_by()
+    )
+    return direct.union(broadcasts, all=True).order_by('-timestamp')
+
+
+def set_broadcast_read(notification, user, is_read):
+    """Record whether `user` has read the broadcast `notification`, keeping their unread counter in step."""
+    with transaction.atomic():
+        receipt, created = NotificationReceipt.objects.select_for_update().get_or_create(
+            notification=notification, user=user, defaults={'is_read': is_read},
+        )
+        was_seen = not created and (receipt.is_read or receipt.is_dismissed)
+        if not created and receipt.is_read != is_read:
+            receipt.is_read = is_read
+            receipt.save(update_fields=['is_read', 'updated_at'])
+        # Only broadcasts the user receives are part of their counter; an
+        # admin editing another role's broadcast keeps their own count.
+        if notification.recipient_role == user.role and notification.timestamp >= user.date_joined:
+            counters.broadcasts_seen({user.id: int(receipt.is_read or receipt.is_dismissed) - int(was_seen)})
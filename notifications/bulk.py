@@ -0,0 +1,52 @@
+"""
+Marking many notifications read at once.
+
+Direct notifications change in one conditional UPDATE. Role broadcasts get
+their missing receipts in one INSERT and are flipped in one more UPDATE.
+The row counts of the conditional UPDATEs are exactly the notifications
+this call changed, so the unread counters move by those amounts even when
+requests overlap.
+"""
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from . import counters
+from .broadcasts import broadcast_filter
+from .models import Notification, NotificationReceipt
+
+
+def mark_read(user, ids=None, up_to_id=None):
+    """
+    Mark `user`'s notifications read: those in `ids`, or every one with an
+    id up to `up_to_id`. Unset sent_at is set to now. Returns how many
+    notifications became read.
+    """
+    if ids is None and up_to_id is None:
+        raise ValueError("Give `ids` or `up_to_id`.")
+    selection = Q(id__in=ids) if ids is not None else Q(id__lte=up_to_id)
+    now = timezone.now()
+
+    with transaction.atomic():
+        direct = Notification.objects.filter(selection, recipient=user, is_read=False).update(
+            is_read=True, sent_at=Coalesce('sent_at', now),
+        )
+
+        unseen = (
+            Notification.objects.filter(selection, broadcast_filter(user))
+            .exclude(receipts__user=user)
+            .values_list('id', flat=True)
+        )
+        NotificationReceipt.objects.bulk_create(
+            [NotificationReceipt(notification_id=notification_id, user=user) for notification_id in unseen],
+            ignore_conflicts=True,
+        )
+        broadcasts = NotificationReceipt.objects.filter(
+            user=user, is_read=False, is_dismissed=False,
+            notification__in=Notification.objects.filter(selection, broadcast_filter(user)),
+        ).update(is_read=True, sent_at=Coalesce('sent_at', now), updated_at=now)
+
+        counters.direct_read({user.id: direct})
+        counters.broadcasts_seen({user.id: broadcasts})
+    return direct + broadcasts
@@ -0,0 +1,93 @@
+"""
+Per-user unread notification counters (see UnreadCounter).
+
+Writes adjust the counters with `UPDATE ... SET n = n + k` in the same
+transaction as the notification change. Counters that do not exist yet are
+left alone and built on first read, and every counter is rebuilt once it
+is older than NOTIFICATION_COUNTER_MAX_AGE, so drift from paths that skip
+these hooks (deletes, raw SQL) never lasts.
+"""
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import BroadcastCounter, Notification, NotificationReceipt, UnreadCounter
+
+
+def counter_max_age():
+    return timedelta(seconds=getattr(settings, 'NOTIFICATION_COUNTER_MAX_AGE', 60 * 60))
+
+
+def _add_per_user(field, steps):
+    """Add `steps[user_id]` to `field` of each user's counter, one UPDATE per distinct step."""
+    by_step = defaultdict(list)
+    for user_id, step in steps.items():
+        if step:
+            by_step[step].append(user_id)
+    for step, user_ids in by_step.items():
+        UnreadCounter.objects.filter(user_id__in=user_ids).update(**{field: F(field) + step})
+
+
+def notifications_added(notifications):
+    """Count newly created notifications: unread direct ones per user, broadcasts per role."""
+    _add_per_user('direct_unread', Counter(
+        notification.recipient_id for notification in notifications
+        if notification.recipient_id is not None and not notification.is_read
+    ))
+    per_role = Counter(
+        notification.recipient_role for notification in notifications
+        if notification.recipient_id is None and notification.recipient_role
+    )
+    for role, count in per_role.items():
+        BroadcastCounter.objects.filter(role=role).update(total=F('total') + count)
+
+
+def direct_read(steps):
+    """`steps` maps user ids to how many of their direct notifications became read (negative: unread)."""
+    _add_per_user('direct_unread', {user_id: -step for user_id, step in steps.items()})
+
+
+def broadcasts_seen(steps):
+    """`steps` maps user ids to how many broadcasts they newly read or dismissed (negative: undone)."""
+    _add_per_user('broadcasts_seen', steps)
+
+
+def reconcile_role(role):
+    total = Notification.objects.filter(recipient__isnull=True, recipient_role=role).count()
+    BroadcastCounter.objects.update_or_create(role=role, defaults={'total': total})
+    return total
+
+
+def reconcile(user):
+    """Rebuild `user`'s counter (and their role's broadcast total) from the notification tables."""
+    direct_unread = Notification.objects.filter(recipient=user, is_read=False).count()
+    before_joining = Notification.objects.filter(
+        recipient__isnull=True, recipient_role=user.role, timestamp__lt=user.date_joined,
+    ).count()
+    seen = NotificationReceipt.objects.filter(
+        Q(is_read=True) | Q(is_dismissed=True),
+        user=user, notification__recipient__isnull=True, notification__recipient_role=user.role,
+        notification__timestamp__gte=user.date_joined,
+    ).count()
+    reconcile_role(user.role)
+    counter, _ = UnreadCounter.objects.update_or_create(user=user, defaults={
+        'role': user.role,
+        'direct_unread': direct_unread,
+        'broadcasts_seen': before_joining + seen,
+        'reconciled_at': timezone.now(),
+    })
+    return counter
+
+
+def unread_count(user):
+    """`user`'s unread notifications: two primary-key reads unless the counter needs rebuilding."""
+    counter = UnreadCounter.objects.filter(user=user).first()
+    if counter is None or counter.role != user.role or counter.reconciled_at < timezone.now() - counter_max_age():
+        counter = reconcile(user)
+    total = BroadcastCounter.objects.filter(role=user.role).values_list('total', flat=True).first()
+    if total is None:
+        total = reconcile_role(user.role)
+    return max(counter.direct_unread, 0) + max(total - counter.broadcasts_seen, 0)
@@ -0,0 +1,170 @@
+"""
+In-process pub/sub hub behind the notification event stream.
+
+Every open stream is an asyncio queue on the worker's event loop, so an idle
+client costs one small object rather than a thread. Notifications saved in
+this process are pushed as soon as their transaction commits (see
+signals.py). Rows written by other processes (other workers, the
+scheduler) are picked up by one shared query per worker every
+NOTIFICATION_STREAM_POLL_INTERVAL seconds, however many clients are
+connected; each poll pages through everything new.
+
+Event ids are notification ids. A client that reconnects with the last id
+it saw gets everything newer replayed from the database.
+"""
+import asyncio
+import json
+from collections import defaultdict, deque
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .models import Notification
+
+
+def stream_setting(name, default):
+    return getattr(settings, f'NOTIFICATION_STREAM_{name}', default)
+
+
+def event_payload(notification):
+    """The JSON-ready event for a notification; built from its own columns only."""
+    return {
+        'id': notification.id,
+        'recipient': notification.recipient_id,
+        'recipient_role': notification.recipient_role,
+        'message': notification.message,
+        'notification_type': notification.notification_type,
+        'timestamp': notification.timestamp.isoformat(),
+        'related_report': notification.related_report_id,
+        'is_read': notification.is_read,
+    }
+
+
+def format_event(payload):
+    return f"id: {payload['id']}\nevent: notification\ndata: {json.dumps(payload)}\n\n"
+
+
+class Subscription:
+    def __init__(self, user, queue_size):
+        self.user_id = user.id
+        self.role = user.role
+        self.joined = user.date_joined
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        # Set when the client fell too far behind; the stream then closes and
+        # the client catches up from the database on reconnect.
+        self.overflowed = False
+        # Ids already sent, so the live, polled and replayed paths never repeat one.
+        self.recent = deque(maxlen=1000)
+        self.recent_ids = set()
+
+    def first_delivery(self, notification_id):
+        """Record `notification_id` as delivered; False if it already was."""
+        if notification_id in self.recent_ids:
+            return False
+        if len(self.recent) == self.recent.maxlen:
+            self.recent_ids.discard(self.recent[0])
+        self.recent.append(notification_id)
+        self.recent_ids.add(notification_id)
+        return True
+
+    def wants(self, payload, timestamp):
+        if payload['recipient'] is not None:
+            return payload['recipient'] == self.user_id
+        return payload['recipient_role'] == self.role and timestamp >= self.joined
+
+    def push(self, payload):
+        if not self.first_delivery(payload['id']):
+            return
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class Hub:
+    def __init__(self):
+        self.loop = None
+        self.by_user = defaultdict(set)
+        self.by_role = defaultdict(set)
+        # Highest id seen by the poller.
+        self.last_id = None
+        self.poller = None
+
+    def __len__(self):
+        return sum(len(subscriptions) for subscriptions in self.by_user.values())
+
+    async def subscribe(self, user):
+        """Register a stream for `user` on the running loop. Returns its Subscription."""
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            # First stream, or the previous loop is gone (e.g. tests).
+            self.loop = loop
+            self.by_user.clear()
+            self.by_role.clear()
+            self.poller = None
+        subscription = Subscription(user, stream_setting('QUEUE_SIZE', 100))
+        self.by_user[subscription.user_id].add(subscription)
+        self.by_role[subscription.role].add(subscription)
+        if self.poller is None or self.poller.done():
+            # The poller stops with the last stream; restart from the newest row.
+            try:
+                last_id = await sync_to_async(latest_notification_id)()
+            except BaseException:
+                self.unsubscribe(subscription)
+                raise
+            if self.poller is None or self.poller.done():
+                self.last_id = last_id
+                self.poller = loop.create_task(self._poll())
+        return subscription
+
+    def unsubscribe(self, subscription):
+        for index, key in ((self.by_user, subscription.user_id), (self.by_role, subscription.role)):
+            index[key].discard(subscription)
+            if not index[key]:
+                del index[key]
+
+    def publish(self, notifications):
+        """Push `notifications` to their subscribers. Safe to call from any thread."""
+        loop = self.loop
+        if loop is None or loop.is_closed() or not self.by_user:
+            return
+        events = [(event_payload(notification), notification.timestamp) for notification in notifications]
+        loop.call_soon_threadsafe(self._dispatch, events)
+
+    def _dispatch(self, events):
+        for payload, timestamp in events:
+            if payload['recipient'] is not None:
+                candidates = self.by_user.get(payload['recipient'], ())
+            else:
+                candidates = self.by_role.get(payload['recipient_role'], ())
+            for subscription in list(candidates):
+                if subscription.wants(payload, timestamp):
+                    subscription.push(payload)
+
+    async def _poll(self):
+        """Publish rows committed by other processes while anyone is listening."""
+        while self.by_user:
+            await asyncio.sleep(stream_setting('POLL_INTERVAL', 5))
+            batch = stream_setting('REPLAY_LIMIT', 100)
+            # Drain everything committed since the last poll, a batch at a
+            # time, so a burst never leaves the streams behind.
+            while self.by_user:
+                rows = await sync_to_async(notifications_after)(self.last_id, batch)
+                if rows:
+                    self.last_id = rows[-1].id
+                    self._dispatch([(event_payload(row), row.timestamp) for row in rows])
+                if len(rows) < batch:
+                    break
+
+
+def latest_notification_id():
+    return Notification.objects.order_by('-id').values_list('id', flat=True).first() or 0
+
+
+def notifications_after(last_id, limit, queryset=None):
+    """Up to `limit` notifications with ids above `last_id`, oldest first."""
+    queryset = Notification.objects.all() if queryset is None else queryset
+    return list(queryset.filter(id__gt=last_id).order_by('id')[:limit])
+
+
+hub = Hub()
@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-18 07:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0007_notification_receipts'),
+        ('users', '0007_alter_customuser_role'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BroadcastCounter',
+            fields=[
+                ('role', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('total', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='UnreadCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='unread_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('role', models.CharField(max_length=50)),
+                ('direct_unread', models.IntegerField(default=0)),
+                ('broadcasts_seen', models.IntegerField(default=0)),
+                ('reconciled_at', models.DateTimeField()),
+            ],
+        ),
+    ]
@@ -14,8 +14,10 @@ class Notification(models.Model):
         ('follow_up', 'Report Follow-Up'),
     ]
 
+    # Empty for role broadcasts: one row for every user with `recipient_role`,
+    # whose per-user read state lives in NotificationReceipt.
     recipient = models.ForeignKey(
-        settings.AUTH_USER_MODEL, on_delete=models.CASCADE
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, null=True, blank=True
     )
     recipient_role = models.CharField(
         max_length=50,
@@ -38,7 +40,73 @@ class Notification(models.Model):
     )
 
     def __str__(self):
-        return f"Notification to {self.recipient.username} ({self.notification_type}) at {self.timestamp}"
+        target = self.recipient.username if self.recipient_id else f"all {self.recipient_role}"
+        return f"Notification to {target} ({self.notification_type}) at {self.timestamp}"
 
     class Meta:
         ordering = ['-timestamp']
+        indexes = [
+            # A user's notification feed, newest first
+            models.Index(fields=['recipient', '-timestamp'], name='notif_recipient_ts_idx'),
+            # Only unread rows: small and hot for badges / unread filters
+            models.Index(
+                fields=['recipient', '-timestamp'],
+                condition=models.Q(is_read=False),
+                name='notif_unread_recipient_idx',
+            ),
+            # Role broadcasts, newest first
+            models.Index(
+                fields=['recipient_role', '-timestamp'],
+                condition=models.Q(recipient__isnull=True),
+                name='notif_broadcast_role_ts_idx',
+            ),
+        ]
+
+
+class NotificationReceipt(models.Model):
+    """
+    One user's state for a role broadcast. Rows exist only once the user
+    has read or dismissed the broadcast; no row means unread.
+    """
+    notification = models.ForeignKey(Notification, on_delete=models.CASCADE, related_name='receipts')
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='notification_receipts')
+    is_read = models.BooleanField(default=False)
+    is_dismissed = models.BooleanField(default=False)
+    sent_at = models.DateTimeField(default=None, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('user', 'notification')
+
+    def __str__(self):
+        return f"Receipt of notification {self.notification_id} for user {self.user_id}"
+
+
+class UnreadCounter(models.Model):
+    """
+    A user's unread notification count, kept current as notifications are
+    sent and read so the badge is a primary-key lookup. Role broadcasts are
+    counted once per role in BroadcastCounter: the user's unread broadcasts
+    are that total minus `broadcasts_seen` (sent before they joined, read or
+    dismissed). Rebuilt from the notification tables when missing, older
+    than NOTIFICATION_COUNTER_MAX_AGE or computed for another role.
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name='unread_counter'
+    )
+    role = models.CharField(max_length=50)
+    direct_unread = models.IntegerField(default=0)
+    broadcasts_seen = models.IntegerField(default=0)
+    reconciled_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"Unread counter of user {self.user_id}"
+
+
+class BroadcastCounter(models.Model):
+    """Number of role broadcasts ever sent to a role."""
+    role = models.CharField(max_length=50, primary_key=True)
+    total = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.total} broadcasts to {self.role}"
@@ -1,4 +1,6 @@
 from rest_framework import serializers
+from . import counters
+from .broadcasts import set_broadcast_read
 from .models import Notification
 from django.contrib.auth import get_user_model
 from reports.serializers import ReportSerializer # Assuming you have a ReportSerializer for related reports
@@ -12,11 +14,15 @@ class NotificationSerializer(serializers.ModelSerializer):
     # Updating the recipient to use user primary key (logged-in user)
     recipient = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), required=False)
 
+    # The current user's read state: for role broadcasts it lives in their receipt
+    is_read = serializers.BooleanField(required=False)
+
     class Meta:
         model = Notification
         fields = [
             'id', 
             'recipient', 
+            'recipient_role', 
             'message', 
             'notification_type', 
             'timestamp', 
@@ -24,7 +30,12 @@ class NotificationSerializer(serializers.ModelSerializer):
             'is_read', 
             'related_report'
         ]
-        read_only_fields = ['id', 'timestamp', 'sent_at', 'is_read']
+        read_only_fields = ['id', 'recipient_role', 'timestamp', 'sent_at']
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data['is_read'] = getattr(instance, 'read_state', instance.is_read)
+        return data
 
     def validate_message(self, value):
         # Adding custom validation for message length
@@ -40,8 +51,21 @@ class NotificationSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
     def update(self, instance, validated_data):
+        if instance.recipient_id is None:
+            # A role broadcast is shared: only this user's receipt changes
+            if 'is_read' in validated_data:
+                set_broadcast_read(instance, self.context['request'].user, validated_data['is_read'])
+                instance.read_state = validated_data['is_read']
+            return instance
+
+        is_read = validated_data.get('is_read', instance.is_read)
+        if is_read != instance.is_read:
+            # Conditional UPDATE: the counter moves only if this request changed the row
+            changed = Notification.objects.filter(pk=instance.pk, is_read=not is_read).update(is_read=is_read)
+            counters.direct_read({instance.recipient_id: changed if is_read else -changed})
+
         # Update existing notification
-        instance.is_read = validated_data.get('is_read', instance.is_read)
+        instance.is_read = is_read
         instance.sent_at = validated_data.get('sent_at', instance.sent_at)
         instance.save()
         return instance
@@ -0,0 +1,57 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import Signal, receiver
+
+from reports.signals import report_status_changed
+from . import counters
+from .live import hub
+from .models import Notification
+
+# Sent after Notification.objects.bulk_create(), which fires no post_save,
+# inside the same transaction.
+#
+# `notifications` is the list of created Notification instances (with ids).
+notifications_created = Signal()
+
+
+@receiver(report_status_changed)
+def notify_report_owners(sender, changes, **kwargs):
+    """Tell each report owner about their report's new status, in one INSERT batch."""
+    notifications = Notification.objects.bulk_create([
+        Notification(
+            recipient_id=change['user_id'],
+            related_report_id=change['id'],
+            notification_type='resolution' if change['new_status'] == 'resolved' else 'status_update',
+            message=f"Your report #{change['id']} changed from {change['old_status']} to {change['new_status']}.",
+        )
+        for change in changes
+    ], batch_size=500)
+    notifications_created.send(sender=Notification, notifications=notifications)
+
+
+# ----- Live event stream -----
+
+@receiver(post_save, sender=Notification)
+def stream_saved_notification(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        transaction.on_commit(partial(hub.publish, [instance]))
+
+
+@receiver(notifications_created)
+def stream_created_notifications(sender, notifications, **kwargs):
+    transaction.on_commit(partial(hub.publish, notifications))
+
+
+# ----- Unread counters -----
+
+@receiver(post_save, sender=Notification)
+def count_saved_notification(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        counters.notifications_added([instance])
+
+
+@receiver(notifications_created)
+def count_created_notifications(sender, notifications, **kwargs):
+    counters.notifications_added(notifications)
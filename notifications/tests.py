@@ -1,3 +1,24 @@
-from django.test import TestCase
+from rest_framework.test import APIRequestFactory
 
-# Create your tests here.
+from reports.tests import QueryPlanTestCase
+from users.models import CustomUser
+from .models import Notification
+from .views import NotificationListCreateView
+
+
+class NotificationQueryPlanTests(QueryPlanTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            email='officer@example.com', username='officer', password='pass', role='law_enforcement'
+        )
+        Notification.objects.create(recipient=cls.user, message='Hello', notification_type='status_update')
+
+    def test_recipient_feed(self):
+        request = APIRequestFactory().get('/api/notifications/')
+        request.user = self.user
+        view = NotificationListCreateView(request=request)
+        self.assertUsesIndex(view.get_queryset())
+
+    def test_unread_feed(self):
+        self.assertUsesIndex(Notification.objects.filter(recipient=self.user, is_read=False))
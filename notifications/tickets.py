@@ -0,0 +1,46 @@
+"""
+Tickets for opening the notification event stream.
+
+EventSource cannot set an Authorization header, and an access token in the
+query string ends up in proxy logs, access logs and browser history. The
+client instead POSTs (with its access token) for a ticket and opens the
+stream with `?ticket=`. A ticket is a signed user id that is only valid for
+the stream, expires after NOTIFICATION_STREAM_TICKET_MAX_AGE seconds
+(default 30) and is accepted once. Single use is recorded in the
+NOTIFICATION_STREAM_TICKET_CACHE cache; use a shared one when the stream
+runs in several processes.
+"""
+import secrets
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.core.cache import caches
+
+from .live import stream_setting
+
+SALT = 'notifications.stream-ticket'
+
+
+def ticket_max_age():
+    return stream_setting('TICKET_MAX_AGE', 30)
+
+
+def _cache():
+    return caches[getattr(settings, 'NOTIFICATION_STREAM_TICKET_CACHE', 'default')]
+
+
+def issue_ticket(user):
+    return signing.dumps({'user': user.pk, 'nonce': secrets.token_urlsafe(16)}, salt=SALT)
+
+
+def redeem_ticket(ticket):
+    """The active user `ticket` was issued to, or None if it is invalid, expired or already used."""
+    max_age = ticket_max_age()
+    try:
+        data = signing.loads(ticket, salt=SALT, max_age=max_age)
+    except signing.BadSignature:
+        return None
+    if not _cache().add(f"stream-ticket:{data['nonce']}", 1, max_age):
+        return None
+    return get_user_model().objects.filter(pk=data['user'], is_active=True).first()
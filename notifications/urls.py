@@ -1,7 +1,14 @@
 from django.urls import path
-from .views import NotificationListCreateView, NotificationUpdateView
+from .views import (
+    NotificationListCreateView, NotificationUpdateView, mark_notifications_read, notification_stream,
+    stream_ticket, unread_count,
+)
 
 urlpatterns = [
     path('', NotificationListCreateView.as_view(), name='notification-list-create'),
+    path('mark-read/', mark_notifications_read, name='notification-mark-read'),
+    path('unread-count/', unread_count, name='notification-unread-count'),
+    path('stream/', notification_stream, name='notification-stream'),
+    path('stream/ticket/', stream_ticket, name='notification-stream-ticket'),
     path('<int:pk>/update/', NotificationUpdateView.as_view(), name='notification-update'),
 ]
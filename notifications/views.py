@@ -1,12 +1,29 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
 from rest_framework import generics
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from . import counters
+from .bulk import mark_read
+from .broadcasts import user_feed, visible_filter, with_receipt
+from .live import event_payload, format_event, hub, notifications_after, stream_setting
 from .models import Notification
 from .serializers import NotificationSerializer
+from .tickets import issue_ticket, redeem_ticket, ticket_max_age
 from .permissions import IsAdminOrAuthenticated  # Use custom permission
 
 class NotificationListCreateView(generics.ListCreateAPIView):
     """
-    List all notifications for the current user.
+    List all notifications for the current user, role broadcasts included.
     Admins see all, others only their own.
     Create logic is retained, but frontend won't use it for now.
     """
@@ -17,8 +34,8 @@ class NotificationListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         user = self.request.user
         if user.role == 'admin':
-            return Notification.objects.all()
-        return Notification.objects.filter(recipient=user)
+            return with_receipt(Notification.objects.all(), user)
+        return user_feed(user)
 
     def perform_create(self, serializer):
         serializer.save(recipient=self.request.user)
@@ -32,3 +49,137 @@ class NotificationUpdateView(generics.UpdateAPIView):
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]  # Allow only authenticated users
     http_method_names = ['patch']
+
+    def get_queryset(self):
+        user = self.request.user
+        if user.role == 'admin':
+            return Notification.objects.all()
+        return Notification.objects.filter(visible_filter(user))
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def unread_count(request):
+    """Number of unread notifications of the current user, for the badge."""
+    return Response({'unread': counters.unread_count(request.user)})
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def mark_notifications_read(request):
+    """
+    Mark the current user's notifications read in bulk: {"ids": [...]} for
+    specific ones, or {"up_to_id": n} for every notification up to id n
+    (mark all read: the newest id the client has seen).
+    """
+    ids = request.data.get('ids') if isinstance(request.data, dict) else None
+    up_to_id = request.data.get('up_to_id') if isinstance(request.data, dict) else None
+    if (ids is None) == (up_to_id is None):
+        return JsonResponse({"error": "Give either 'ids' or 'up_to_id'."}, status=400)
+
+    if ids is not None:
+        max_items = getattr(settings, 'NOTIFICATIONS_BULK_MAX_ITEMS', 5000)
+        if not isinstance(ids, list) or not all(isinstance(item, int) and not isinstance(item, bool) for item in ids):
+            return JsonResponse({"error": "'ids' must be a list of notification ids."}, status=400)
+        if len(ids) > max_items:
+            return JsonResponse({"error": f"At most {max_items} ids per request."}, status=400)
+    elif not isinstance(up_to_id, int) or isinstance(up_to_id, bool):
+        return JsonResponse({"error": "'up_to_id' must be a notification id."}, status=400)
+
+    marked = mark_read(request.user, ids=ids, up_to_id=up_to_id)
+    return Response({'marked': marked, 'unread': counters.unread_count(request.user)})
+
+
+# ======== Live event stream ========
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def stream_ticket(request):
+    """A short-lived, single-use ticket for opening the event stream (see tickets.py)."""
+    return Response({'ticket': issue_ticket(request.user), 'expires_in': ticket_max_age()})
+
+
+def stream_user(request):
+    """
+    The user of the request's access token (Authorization header) or of its
+    `ticket` query parameter. Access tokens are not taken from the query
+    string, where they would be logged.
+    """
+    if request.GET.get('ticket'):
+        return redeem_ticket(request.GET['ticket'])
+    authentication = JWTAuthentication()
+    try:
+        result = authentication.authenticate(request)
+    except (InvalidToken, AuthenticationFailed):
+        return None
+    return result[0] if result else None
+
+
+def replay(user, cursor, limit):
+    """The user's notifications after `cursor`, or None if there are more than `limit`."""
+    rows = notifications_after(cursor, limit + 1, Notification.objects.filter(visible_filter(user)))
+    return rows if len(rows) <= limit else None
+
+
+def latest_visible_id(user):
+    return Notification.objects.filter(visible_filter(user)).order_by('-id').values_list('id', flat=True).first() or 0
+
+
+async def event_stream(user, cursor):
+    subscription = await hub.subscribe(user)
+    heartbeat = stream_setting('HEARTBEAT', 15)
+    try:
+        if cursor is not None:
+            rows = await sync_to_async(replay)(user, cursor, stream_setting('REPLAY_LIMIT', 100))
+            if rows is None:
+                # Too far behind to replay: the client reloads its list instead.
+                latest = await sync_to_async(latest_visible_id)(user)
+                yield f"id: {latest}\nevent: resync\ndata: {{}}\n\n"
+            else:
+                for row in rows:
+                    if subscription.first_delivery(row.id):
+                        yield format_event(event_payload(row))
+
+        # A client that falls behind is dropped and replays on reconnect.
+        while not subscription.overflowed:
+            try:
+                payload = await asyncio.wait_for(subscription.queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield format_event(payload)
+    finally:
+        hub.unsubscribe(subscription)
+
+
+@require_GET
+async def notification_stream(request):
+    """
+    Server-Sent Events stream of the user's new notifications (event
+    `notification`, id = notification id). Resumes after the Last-Event-ID
+    header or `last_event_id` parameter; sends `resync` when too much was
+    missed to replay.
+
+    Only served by the ASGI application (crime_reporting/asgi.py): under
+    WSGI the endless stream would be read to completion and hold a worker
+    forever.
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({"error": "The notification stream is served by the ASGI application."}, status=404)
+
+    user = await sync_to_async(stream_user)(request)
+    if user is None:
+        return JsonResponse({"error": "Authentication credentials were not provided or are invalid."}, status=401)
+
+    cursor = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    if cursor is not None:
+        try:
+            cursor = int(cursor)
+        except ValueError:
+            return JsonResponse({"error": "Last-Event-ID must be a notification id."}, status=400)
+
+    return StreamingHttpResponse(
+        event_stream(user, cursor),
+        content_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
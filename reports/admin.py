@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Report
+from .models import Report, ReportStatusChange
 
 @admin.register(Report)
 class ReportAdmin(admin.ModelAdmin):
@@ -13,3 +13,14 @@ class ReportAdmin(admin.ModelAdmin):
 
     location.admin_order_field = 'latitude'  # Optionally, allow sorting by latitude in the admin
     location.short_description = 'Location'  # Custom column name in the admin UI
+
+
+@admin.register(ReportStatusChange)
+class ReportStatusChangeAdmin(admin.ModelAdmin):
+    # Append-only history written on every status change
+    list_display = ('report_id', 'category', 'from_status', 'to_status', 'changed_by', 'changed_at')
+    ordering = ('-changed_at',)
+    list_filter = ('to_status', 'category')
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,102 @@
+from datetime import datetime, time, timedelta
+
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Report
+
+STATUSES = [value for value, _ in Report.STATUS_CHOICES]
+CATEGORIES = [value for value, _ in Report.CATEGORY_CHOICES]
+
+# Reports whose category is blank (or outside the choices) are grouped here.
+UNCATEGORIZED = 'uncategorized'
+
+
+class ReportSummary:
+    """
+    Totals, per-status, per-category and per-day report counts, all computed
+    by one aggregate query (see `summarize`). Role-specific responses are
+    projections of this one result.
+    """
+
+    def __init__(self, total, by_status, by_category, by_day, extra=None):
+        self.total = total
+        self.by_status = by_status
+        self.by_category = by_category
+        self.by_day = by_day
+        self.extra = extra or {}
+
+    @staticmethod
+    def _ranked(counts, key, keys=None):
+        """Non-zero buckets as [{key: ..., 'count': n}], largest first."""
+        items = [(name, count) for name, count in counts.items() if count and (keys is None or name in keys)]
+        items.sort(key=lambda item: -item[1])
+        return [{key: name, 'count': count} for name, count in items]
+
+    def status_list(self, statuses=None):
+        return self._ranked(self.by_status, 'status', statuses)
+
+    def category_list(self):
+        return self._ranked(self.by_category, 'category')
+
+    def day_list(self):
+        return [{'day': day, 'count': count} for day, count in self.by_day.items() if count]
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def summarize(queryset, since=None, weight=None, day_field='created_at', extra=None):
+    """
+    Aggregate `queryset` in a single scan using conditional aggregates
+    (`COUNT(*) FILTER (WHERE ...)` on PostgreSQL).
+
+    `since` (a date) adds one bucket per day from `since` to today.
+    `weight` names a field to SUM instead of counting rows, and `day_field`
+    may be a DateField, so the same engine runs over pre-aggregated rows such
+    as the daily rollup. `extra` aggregates ride along in the same query and
+    are returned in `summary.extra`.
+    """
+    def measure(condition=None):
+        if weight is None:
+            return Count('pk', filter=condition)
+        return Coalesce(Sum(weight, filter=condition), 0)
+
+    days = []
+    if since is not None:
+        day = since
+        today = timezone.localdate()
+        while day <= today:
+            days.append(day)
+            day += timedelta(days=1)
+
+    aggregates = {'total': measure()}
+    for index, status in enumerate(STATUSES):
+        aggregates[f'status_{index}'] = measure(Q(status=status))
+    for index, category in enumerate(CATEGORIES):
+        aggregates[f'category_{index}'] = measure(Q(category=category))
+    date_is_datetime = queryset.model._meta.get_field(day_field).get_internal_type() == 'DateTimeField'
+    for index, day in enumerate(days):
+        if date_is_datetime:
+            condition = Q(**{
+                f'{day_field}__gte': _day_start(day),
+                f'{day_field}__lt': _day_start(day + timedelta(days=1)),
+            })
+        else:
+            condition = Q(**{day_field: day})
+        aggregates[f'day_{index}'] = measure(condition)
+
+    extra = extra or {}
+    result = queryset.order_by().aggregate(**aggregates, **extra)
+
+    by_status = {status: result[f'status_{index}'] for index, status in enumerate(STATUSES)}
+    by_category = {category: result[f'category_{index}'] for index, category in enumerate(CATEGORIES)}
+    by_category[UNCATEGORIZED] = result['total'] - sum(by_category.values())
+    by_day = {day: result[f'day_{index}'] for index, day in enumerate(days)}
+
+    return ReportSummary(
+        result['total'], by_status, by_category, by_day,
+        extra={name: result[name] for name in extra},
+    )
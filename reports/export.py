@@ -0,0 +1,117 @@
+import csv
+import json
+
+from django.conf import settings
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+    'geojson': 'application/geo+json',
+}
+
+EXPORT_FIELDS = [
+    'id',
+    'user_id',
+    'category',
+    'description',
+    'status',
+    'latitude',
+    'longitude',
+    'created_at',
+    'updated_at',
+]
+
+# Rows are joined into one string per this many lines before being handed to
+# the response, so the WSGI server is not asked to flush every single row.
+LINES_PER_WRITE = 500
+
+
+def get_chunk_size():
+    return getattr(settings, 'REPORTS_EXPORT_CHUNK_SIZE', 2000)
+
+
+def _format_datetime(value):
+    # Same shape DRF uses for DateTimeField output.
+    value = value.isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def _iter_rows(queryset, chunk_size):
+    """
+    Yield one dict per report straight from the database cursor.
+
+    `.iterator()` keeps only `chunk_size` rows in memory (a server-side cursor
+    on PostgreSQL), so export memory stays flat regardless of table size.
+    """
+    rows = queryset.order_by('id').values_list(*EXPORT_FIELDS).iterator(chunk_size=chunk_size)
+    for row in rows:
+        item = dict(zip(EXPORT_FIELDS, row))
+        item['created_at'] = _format_datetime(item['created_at'])
+        item['updated_at'] = _format_datetime(item['updated_at'])
+        yield item
+
+
+def _buffered(lines):
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= LINES_PER_WRITE:
+            yield ''.join(buffer)
+            buffer = []
+    if buffer:
+        yield ''.join(buffer)
+
+
+class _Echo:
+    """File-like object whose write() hands the value back to the caller."""
+
+    def write(self, value):
+        return value
+
+
+def iter_ndjson(queryset, chunk_size):
+    for item in _iter_rows(queryset, chunk_size):
+        yield json.dumps(item) + '\n'
+
+
+def iter_csv(queryset, chunk_size):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for item in _iter_rows(queryset, chunk_size):
+        yield writer.writerow([item[field] for field in EXPORT_FIELDS])
+
+
+def iter_geojson(queryset, chunk_size):
+    yield '{"type": "FeatureCollection", "features": [\n'
+    separator = ''
+    for item in _iter_rows(queryset, chunk_size):
+        feature = {
+            'type': 'Feature',
+            'id': item['id'],
+            'geometry': {
+                'type': 'Point',
+                'coordinates': [item.pop('longitude'), item.pop('latitude')],
+            },
+            'properties': item,
+        }
+        yield separator + json.dumps(feature)
+        separator = ',\n'
+    yield '\n]}\n'
+
+
+_WRITERS = {
+    'ndjson': iter_ndjson,
+    'csv': iter_csv,
+    'geojson': iter_geojson,
+}
+
+
+def stream_reports(queryset, export_format, chunk_size=None):
+    """
+    Return an iterator of text chunks encoding `queryset` in `export_format`.
+    """
+    if chunk_size is None:
+        chunk_size = get_chunk_size()
+    return _buffered(_WRITERS[export_format](queryset, chunk_size))
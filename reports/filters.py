@@ -0,0 +1,109 @@
+from datetime import datetime, time
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from . import geo
+
+
+def parse_moment(name, value):
+    """
+    Accept either an ISO date or datetime. Bare dates mean midnight in the
+    current timezone so `created_before=2025-05-01` excludes May 1st itself.
+    """
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValidationError({name: f"Invalid date or datetime: {value!r}"})
+        moment = datetime.combine(day, time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def _split(value):
+    return [item for item in value.split(',') if item]
+
+
+BBOX_PARAMS = ('min_lat', 'min_lon', 'max_lat', 'max_lon')
+
+
+def _parse_bbox(params):
+    values = [params.get(key) for key in BBOX_PARAMS]
+    if not any(values):
+        return None
+    try:
+        return tuple(float(value) for value in values)
+    except (TypeError, ValueError):
+        raise ValidationError({"bbox": f"{', '.join(BBOX_PARAMS)} must all be given as numbers."})
+
+
+def _parse_ids(name, value):
+    try:
+        return [int(item) for item in _split(value)]
+    except ValueError:
+        raise ValidationError({name: f"Expected comma separated ids, got {value!r}"})
+
+
+def filter_reports(queryset, params):
+    """
+    Apply the common report filters from a query-param style mapping.
+
+    Supported keys:
+      status          comma separated list of statuses
+      category        comma separated list of categories
+      user            comma separated list of user ids
+      created_after   ISO date/datetime, inclusive
+      created_before  ISO date/datetime, exclusive
+      min_lat, min_lon, max_lat, max_lon
+                      bounding box, all four required together
+
+    Every filter is pushed into SQL; nothing is evaluated here.
+    """
+    status = params.get('status')
+    if status:
+        queryset = queryset.filter(status__in=_split(status))
+
+    category = params.get('category')
+    if category:
+        queryset = queryset.filter(category__in=_split(category))
+
+    user = params.get('user')
+    if user:
+        queryset = queryset.filter(user_id__in=_parse_ids('user', user))
+
+    created_after = params.get('created_after')
+    if created_after:
+        queryset = queryset.filter(created_at__gte=parse_moment('created_after', created_after))
+
+    created_before = params.get('created_before')
+    if created_before:
+        queryset = queryset.filter(created_at__lt=parse_moment('created_before', created_before))
+
+    bbox = _parse_bbox(params)
+    if bbox is not None:
+        queryset = within_bbox(queryset, *bbox)
+
+    return queryset
+
+
+def within_bbox(queryset, min_lat, min_lon, max_lat, max_lon):
+    """
+    Restrict reports to a lat/lon box.
+
+    The geohash cells covering the box become indexed range scans on
+    `geohash`; the exact lat/lon bounds then drop the cell overhang.
+    """
+    cells = Q()
+    for prefix in geo.cover(min_lat, min_lon, max_lat, max_lon):
+        cells |= Q(geohash__range=geo.prefix_range(prefix))
+    return queryset.filter(
+        cells,
+        latitude__gte=min_lat,
+        latitude__lte=max_lat,
+        longitude__gte=min_lon,
+        longitude__lte=max_lon,
+    )
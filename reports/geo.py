@@ -0,0 +1,145 @@
+"""
+Plain-Python spatial helpers for reports.
+
+Reports carry a geohash of their coordinates in an ordinary indexed
+CharField. Every geohash cell is a contiguous key range, so "reports inside
+this box" becomes a handful of indexed range scans on any database, with no
+PostGIS required. Exact distance filtering happens afterwards on the
+(already small) candidate set.
+"""
+import math
+
+GEOHASH_PRECISION = 9  # ~4.8m x 4.8m cells
+EARTH_RADIUS_KM = 6371.0088
+
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+# Upper bound on the number of cells used to cover a query box. Coarser cells
+# mean fewer range scans but more false positives to discard.
+MAX_COVER_CELLS = 16
+
+
+def encode(latitude, longitude, precision=GEOHASH_PRECISION):
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        if even:
+            mid = (lon_range[0] + lon_range[1]) / 2
+            if longitude >= mid:
+                bits = (bits << 1) | 1
+                lon_range[0] = mid
+            else:
+                bits <<= 1
+                lon_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if latitude >= mid:
+                bits = (bits << 1) | 1
+                lat_range[0] = mid
+            else:
+                bits <<= 1
+                lat_range[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return ''.join(chars)
+
+
+def bounds(cell):
+    """Return (min_lat, min_lon, max_lat, max_lon) of a geohash cell."""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    even = True
+    for char in cell:
+        value = _BASE32.index(char)
+        for shift in range(4, -1, -1):
+            bound = lon_range if even else lat_range
+            mid = (bound[0] + bound[1]) / 2
+            if (value >> shift) & 1:
+                bound[0] = mid
+            else:
+                bound[1] = mid
+            even = not even
+    return lat_range[0], lon_range[0], lat_range[1], lon_range[1]
+
+
+def cell_size(precision):
+    """Return (lat_degrees, lon_degrees) covered by one cell at `precision`."""
+    total_bits = 5 * precision
+    lon_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def _cells_for_box(min_lat, min_lon, max_lat, max_lon, precision):
+    lat_step, lon_step = cell_size(precision)
+    lat_start = math.floor((min_lat + 90.0) / lat_step)
+    lat_end = math.floor((max_lat + 90.0) / lat_step)
+    lon_start = math.floor((min_lon + 180.0) / lon_step)
+    lon_end = math.floor((max_lon + 180.0) / lon_step)
+    count = (lat_end - lat_start + 1) * (lon_end - lon_start + 1)
+    if count > MAX_COVER_CELLS:
+        return None
+
+    cells = set()
+    for lat_index in range(lat_start, lat_end + 1):
+        lat = min(-90.0 + (lat_index + 0.5) * lat_step, 90.0)
+        for lon_index in range(lon_start, lon_end + 1):
+            lon = min(-180.0 + (lon_index + 0.5) * lon_step, 180.0)
+            cells.add(encode(lat, lon, precision))
+    return cells
+
+
+def cover(min_lat, min_lon, max_lat, max_lon):
+    """
+    Return the set of geohash prefixes whose cells cover the bounding box,
+    using the finest precision that needs at most MAX_COVER_CELLS cells.
+    """
+    min_lat, max_lat = max(min_lat, -90.0), min(max_lat, 90.0)
+    min_lon, max_lon = max(min_lon, -180.0), min(max_lon, 180.0)
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        cells = _cells_for_box(min_lat, min_lon, max_lat, max_lon, precision)
+        if cells is not None:
+            return cells
+    # The box is larger than the coarsest cells allow: use every top cell.
+    return set(_BASE32)
+
+
+def prefix_range(prefix):
+    """
+    Inclusive key range of every full-precision geohash starting with
+    `prefix`. It only uses geohash characters, so it sorts the same under any
+    database collation and maps onto a plain B-tree range scan.
+    """
+    return prefix, prefix + _BASE32[-1] * (GEOHASH_PRECISION - len(prefix))
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bbox_around(latitude, longitude, radius_km):
+    """Smallest lat/lon box containing the circle of `radius_km` around a point."""
+    lat_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = math.cos(math.radians(latitude))
+    if cos_lat < 1e-12:
+        lon_delta = 180.0
+    else:
+        lon_delta = min(180.0, math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat)))
+    return (
+        latitude - lat_delta,
+        longitude - lon_delta,
+        latitude + lat_delta,
+        longitude + lon_delta,
+    )
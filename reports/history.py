@@ -0,0 +1,26 @@
+from django.utils import timezone
+
+from .models import ReportStatusChange
+
+
+def record_status_changes(changes, changed_by=None, changed_at=None):
+    """
+    Append one ReportStatusChange per transition, in a single INSERT.
+
+    `changes` are dicts with id, category, created_at, old_status and
+    new_status (the `report_status_changed` payload).
+    """
+    changed_at = changed_at or timezone.now()
+    ReportStatusChange.objects.bulk_create([
+        ReportStatusChange(
+            report_id=change['id'],
+            category=change['category'],
+            from_status=change['old_status'],
+            to_status=change['new_status'],
+            changed_by=changed_by,
+            changed_at=changed_at,
+            report_created_at=change['created_at'],
+            seconds_open=max(0, int((changed_at - change['created_at']).total_seconds())),
+        )
+        for change in changes
+    ], batch_size=1000)
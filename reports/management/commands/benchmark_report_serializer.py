@@ -0,0 +1,78 @@
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import ListSerializer
+
+from reports.models import Report
+from reports.serializers import ReportSerializer
+
+
+def sample_reports(count, seed=0):
+    """`count` unsaved reports with realistic field values; nothing touches the database."""
+    rng = random.Random(seed)
+    categories = [value for value, _ in Report.CATEGORY_CHOICES]
+    statuses = [value for value, _ in Report.STATUS_CHOICES]
+    start = timezone.now() - timedelta(days=365)
+    reports = []
+    for pk in range(1, count + 1):
+        created_at = start + timedelta(seconds=rng.randrange(365 * 24 * 60 * 60), microseconds=rng.randrange(10 ** 6))
+        reports.append(Report(
+            id=pk,
+            user_id=rng.randrange(1, 1000),
+            category=rng.choice(categories),
+            description=f"Report {pk}: incident reported near the market",
+            status=rng.choice(statuses),
+            latitude=round(rng.uniform(-4.5, 4.5), 6),
+            longitude=round(rng.uniform(33.5, 42.0), 6),
+            created_at=created_at,
+            updated_at=created_at + timedelta(hours=rng.randrange(72)),
+        ))
+    return reports
+
+
+class Command(BaseCommand):
+    help = (
+        "Time ReportSerializer(many=True) (the read-only list fast path) against DRF's "
+        "per-row ListSerializer, and check both render the same JSON. "
+        "Uses in-memory reports; nothing is read from or written to the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100000)
+        parser.add_argument('--repeat', type=int, default=3, help="Runs per path; the best one is reported")
+
+    def handle(self, *args, **options):
+        if options['rows'] < 1 or options['repeat'] < 1:
+            raise CommandError("--rows and --repeat must be positive")
+        reports = sample_reports(options['rows'])
+        renderer = JSONRenderer()
+
+        def per_row():
+            # What many=True did before: every field's to_representation per report.
+            return ListSerializer(reports, child=ReportSerializer()).data
+
+        def fast_path():
+            return ReportSerializer(reports, many=True).data
+
+        timings = {}
+        outputs = {}
+        for name, run in (('per-row', per_row), ('list fast path', fast_path)):
+            best = None
+            for _ in range(options['repeat']):
+                started = time.perf_counter()
+                data = run()
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            timings[name] = best
+            outputs[name] = renderer.render(data)
+            self.stdout.write(f"{name:<16} {best:8.3f}s")
+
+        if outputs['per-row'] != outputs['list fast path']:
+            raise CommandError("The two paths rendered different JSON.")
+        self.stdout.write(self.style.SUCCESS(
+            f"{options['rows']} reports: {timings['per-row'] / timings['list fast path']:.1f}x faster, identical JSON."
+        ))
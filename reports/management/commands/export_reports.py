@@ -0,0 +1,43 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from reports.export import EXPORT_FORMATS, get_chunk_size, stream_reports
+from reports.filters import filter_reports
+from reports.models import Report
+
+
+class Command(BaseCommand):
+    help = "Stream all reports (optionally filtered) to a file or stdout as NDJSON, CSV or GeoJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', dest='export_format', choices=sorted(EXPORT_FORMATS), default='ndjson')
+        parser.add_argument('--output', '-o', help="Output file path (defaults to stdout)")
+        parser.add_argument('--status', help="Comma separated statuses to include")
+        parser.add_argument('--category', help="Comma separated categories to include")
+        parser.add_argument('--created-after', help="ISO date/datetime, inclusive")
+        parser.add_argument('--created-before', help="ISO date/datetime, exclusive")
+        parser.add_argument('--chunk-size', type=int, default=get_chunk_size())
+
+    def handle(self, *args, **options):
+        params = {
+            'status': options['status'],
+            'category': options['category'],
+            'created_after': options['created_after'],
+            'created_before': options['created_before'],
+        }
+        try:
+            reports = filter_reports(Report.objects.all(), params)
+        except ValidationError as exc:
+            raise CommandError(exc.detail)
+
+        chunks = stream_reports(reports, options['export_format'], chunk_size=options['chunk_size'])
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8', newline='') as handle:
+                for chunk in chunks:
+                    handle.write(chunk)
+        else:
+            for chunk in chunks:
+                sys.stdout.write(chunk)
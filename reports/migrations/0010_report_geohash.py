@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-18 06:19
+
+from django.db import migrations, models
+
+from reports import geo
+
+
+def backfill_geohash(apps, schema_editor):
+    Report = apps.get_model('reports', 'Report')
+    batch = []
+    for report in Report.objects.only('id', 'latitude', 'longitude').iterator(chunk_size=2000):
+        report.geohash = geo.encode(report.latitude, report.longitude)
+        batch.append(report)
+        if len(batch) >= 2000:
+            Report.objects.bulk_update(batch, ['geohash'])
+            batch = []
+    if batch:
+        Report.objects.bulk_update(batch, ['geohash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0009_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='report',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=12),
+        ),
+        migrations.RunPython(backfill_geohash, migrations.RunPython.noop),
+    ]
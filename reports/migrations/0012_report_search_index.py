@@ -0,0 +1,84 @@
+from django.db import migrations
+
+POSTGRESQL_FORWARD = [
+    """
+    ALTER TABLE reports_report ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('english', coalesce(description, ''))) STORED
+    """,
+    "CREATE INDEX report_search_vector_idx ON reports_report USING GIN (search_vector)",
+]
+
+POSTGRESQL_REVERSE = [
+    "DROP INDEX IF EXISTS report_search_vector_idx",
+    "ALTER TABLE reports_report DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE reports_report_fts USING fts5(
+        description, content='reports_report', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER reports_report_fts_ai AFTER INSERT ON reports_report BEGIN
+        INSERT INTO reports_report_fts(rowid, description) VALUES (new.id, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER reports_report_fts_ad AFTER DELETE ON reports_report BEGIN
+        INSERT INTO reports_report_fts(reports_report_fts, rowid, description)
+            VALUES ('delete', old.id, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER reports_report_fts_au AFTER UPDATE OF description ON reports_report BEGIN
+        INSERT INTO reports_report_fts(reports_report_fts, rowid, description)
+            VALUES ('delete', old.id, old.description);
+        INSERT INTO reports_report_fts(rowid, description) VALUES (new.id, new.description);
+    END
+    """,
+    "INSERT INTO reports_report_fts(reports_report_fts) VALUES ('rebuild')",
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS reports_report_fts_au",
+    "DROP TRIGGER IF EXISTS reports_report_fts_ad",
+    "DROP TRIGGER IF EXISTS reports_report_fts_ai",
+    "DROP TABLE IF EXISTS reports_report_fts",
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRESQL_FORWARD)
+    elif vendor == 'sqlite':
+        _run(schema_editor, SQLITE_FORWARD)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRESQL_REVERSE)
+    elif vendor == 'sqlite':
+        _run(schema_editor, SQLITE_REVERSE)
+
+
+class Migration(migrations.Migration):
+    """
+    Database-maintained full-text index on Report.description; see reports/search.py.
+    The column / virtual table is not part of the Django model state.
+    """
+
+    dependencies = [
+        ('reports', '0011_report_category_created_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
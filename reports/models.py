@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, transaction
+from . import geo
 from users.models import CustomUser  # Ensure this is the correct import for your CustomUser model
 
 class Report(models.Model):
@@ -23,6 +24,7 @@ class Report(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')  # Report status
     latitude = models.FloatField(default=0.0)  # Latitude for geographic location
     longitude = models.FloatField(default=0.0)  # Longitude for geographic location
+    geohash = models.CharField(max_length=12, blank=True, default='', editable=False, db_index=True)  # Spatial grid key, kept in sync on save
     created_at = models.DateTimeField(auto_now_add=True)  # Timestamp when report is created
     updated_at = models.DateTimeField(auto_now=True)  # Timestamp when report is last updated
 
@@ -38,8 +40,100 @@ class Report(models.Model):
         """
         return f"Lat: {self.latitude}, Lon: {self.longitude}"
 
+    # Stored values that post_save receivers need to see transitions
+    TRACKED_FIELDS = ('category', 'status', 'geohash')
+    _loaded_state = None
+
+    def save(self, *args, **kwargs):
+        self.geohash = geo.encode(self.latitude, self.longitude)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'latitude', 'longitude'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'geohash'}
+
+        # post_save receivers compare against the state the instance was
+        # loaded with to tell which transition just happened.
+        self.previous_state = None
+        if self.pk is not None and not self._state.adding:
+            self.previous_state = self._loaded_state
+            if self.previous_state is None or set(self.previous_state) != set(self.TRACKED_FIELDS):
+                # Loaded with some tracked fields deferred.
+                self.previous_state = (
+                    Report.objects.filter(pk=self.pk).values(*self.TRACKED_FIELDS).first()
+                )
+            if self.previous_state is not None and kwargs.get('update_fields') is not None:
+                # Fields left out of update_fields keep their stored value.
+                self.previous_state = {
+                    name: value if name in kwargs['update_fields'] else getattr(self, name)
+                    for name, value in self.previous_state.items()
+                }
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+        self._remember_state(kwargs.get('update_fields'))
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_state()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using, fields, **kwargs)
+        self._remember_state(fields)
+
+    def _remember_state(self, fields=None):
+        """Record the tracked values just read or written (`fields` only, if given)."""
+        state = dict(self._loaded_state or {})
+        for name in self.TRACKED_FIELDS:
+            if name in self.__dict__ and (fields is None or name in fields):
+                state[name] = self.__dict__[name]
+        self._loaded_state = state
+
     def __str__(self):
         return f"Report by {self.user.email} ({self.category}) - {self.status}"
 
     class Meta:
-        ordering = ['-created_at']  # Orders reports by creation time (most recent first)
+        ordering = ['-created_at', '-id']  # Most recent first; id breaks ties for cursor pagination
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='report_created_id_idx'),
+            # Status-filtered lists (officer dashboards) in list order
+            models.Index(fields=['status', '-created_at', '-id'], name='report_status_created_idx'),
+            # Category-filtered lists in list order
+            models.Index(fields=['category', '-created_at', '-id'], name='report_category_created_idx'),
+            # A citizen's own reports in list order
+            models.Index(fields=['user', '-created_at', '-id'], name='report_user_created_idx'),
+            # Rows changed since a point in time (analytics snapshot deltas)
+            models.Index(fields=['updated_at'], name='report_updated_idx'),
+        ]
+
+
+class ReportStatusChange(models.Model):
+    """
+    Append-only log of report status transitions. Category and creation time
+    are copied from the report so that resolution analytics can be answered
+    from the history rows alone (and survive the report being deleted).
+    """
+    report = models.ForeignKey(
+        Report, on_delete=models.DO_NOTHING, db_constraint=False, related_name='status_changes'
+    )
+    category = models.CharField(max_length=50)
+    from_status = models.CharField(max_length=20)
+    to_status = models.CharField(max_length=20)
+    changed_by = models.ForeignKey(CustomUser, null=True, blank=True, on_delete=models.SET_NULL)
+    changed_at = models.DateTimeField()
+    report_created_at = models.DateTimeField()
+    seconds_open = models.PositiveBigIntegerField()  # changed_at - report_created_at
+
+    def __str__(self):
+        return f"Report {self.report_id}: {self.from_status} -> {self.to_status} at {self.changed_at}"
+
+    class Meta:
+        ordering = ['changed_at', 'id']
+        indexes = [
+            # A report's timeline
+            models.Index(fields=['report', 'changed_at'], name='status_change_report_idx'),
+            # Covers resolution analytics: filter on the first two, read the rest from the index
+            models.Index(
+                fields=['to_status', 'changed_at', 'category', 'seconds_open'],
+                name='status_change_to_status_idx',
+            ),
+        ]
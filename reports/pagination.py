@@ -0,0 +1,147 @@
+import base64
+from urllib import parse
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class ReportCursorPagination:
+    """
+    Keyset pagination for report lists, keyed on (created_at, id).
+
+    Pages are fetched with a WHERE clause on the last seen position instead of
+    OFFSET, so page 1,000 costs the same as page 1 and no COUNT(*) is issued.
+    The cursor is opaque to clients: follow the `next` / `previous` links.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    ordering = ('-created_at', '-id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    def __init__(self):
+        self.page_size = getattr(settings, 'REPORTS_PAGE_SIZE', 50)
+        self.max_page_size = getattr(settings, 'REPORTS_MAX_PAGE_SIZE', 500)
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def page_queryset(self, queryset, request):
+        """The unevaluated query for the requested page (plus one row to detect a next page)."""
+        self.request = request
+        self.page_size_value = self.get_page_size(request)
+        self.cursor = self.decode_cursor(request)
+
+        if self.cursor is None:
+            self.reverse = False
+        else:
+            created_at, pk, self.reverse = self.cursor
+            if self.reverse:
+                # Walking back towards newer reports.
+                queryset = queryset.filter(
+                    Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+                )
+
+        if self.reverse:
+            queryset = queryset.order_by('created_at', 'id')
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        # Fetch one extra row to learn whether another page exists.
+        return queryset[:self.page_size_value + 1]
+
+    def paginate_queryset(self, queryset, request):
+        rows = list(self.page_queryset(queryset, request))
+        has_more = len(rows) > self.page_size_value
+        rows = rows[:self.page_size_value]
+
+        if self.reverse:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+
+        self.page = rows
+        return rows
+
+    # ----- Cursor encoding -----
+
+    @staticmethod
+    def _position(row):
+        if isinstance(row, dict):
+            return row['created_at'], row['id']
+        return row.created_at, row.id
+
+    def encode_cursor(self, created_at, pk, reverse):
+        raw = f"{'b' if reverse else 'a'}|{created_at.isoformat()}|{pk}"
+        token = base64.urlsafe_b64encode(raw.encode('ascii')).decode('ascii')
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(parse.unquote(token).encode('ascii')).decode('ascii')
+            direction, created_at, pk = raw.split('|')
+            created_at = parse_datetime(created_at)
+            pk = int(pk)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if created_at is None or direction not in ('a', 'b'):
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, pk, direction == 'b'
+
+    # ----- Links -----
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if self.page:
+            created_at, pk = self._position(self.page[-1])
+            return self.encode_cursor(created_at, pk, reverse=False)
+        # Empty page reached by walking backwards past the newest report.
+        created_at, pk, _ = self.cursor
+        return self.encode_cursor(created_at, pk, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.page:
+            created_at, pk = self._position(self.page[0])
+            return self.encode_cursor(created_at, pk, reverse=True)
+        created_at, pk, _ = self.cursor
+        return self.encode_cursor(created_at, pk, reverse=True)
+
+    def get_headers(self):
+        links = []
+        next_link = self.get_next_link()
+        previous_link = self.get_previous_link()
+        if next_link:
+            links.append(f'<{next_link}>; rel="next"')
+        if previous_link:
+            links.append(f'<{previous_link}>; rel="prev"')
+        return {'Link': ', '.join(links)} if links else {}
+
+    def get_paginated_response(self, data):
+        """
+        Keep the response body a plain list (the frontend expects one) and
+        expose the next / previous cursors through the Link header.
+        """
+        return Response(data, headers=self.get_headers())
@@ -0,0 +1,96 @@
+"""
+Versioned cache for read-heavy summary responses.
+
+Every cached value is tied to the current version of the data namespaces it
+depends on ('reports', 'crimestats'). Writes bump the version once their
+transaction commits, which orphans every dependent entry at once; nothing
+relies on TTLs to become fresh again. On a miss a single caller recomputes
+while concurrent callers wait for its result instead of stampeding the
+database.
+
+Works with any Django cache backend. Use a shared one (file-based, Redis,
+memcached) when several worker processes must see the same invalidations.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+KEY_PREFIX = 'respcache'
+
+
+def _cache():
+    return caches[getattr(settings, 'RESPONSE_CACHE_ALIAS', 'default')]
+
+
+def _version_key(namespace):
+    return f'{KEY_PREFIX}:version:{namespace}'
+
+
+def _fresh_version():
+    # Time based, so a version evicted from the cache is never reissued.
+    return time.time_ns()
+
+
+def get_versions(namespaces):
+    cache = _cache()
+    keys = [_version_key(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _fresh_version(), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_version(namespace):
+    """Invalidate every entry depending on `namespace` once the current transaction commits."""
+    def bump():
+        cache = _cache()
+        key = _version_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _fresh_version(), None)
+
+    transaction.on_commit(bump)
+
+
+def cached(name, namespaces, compute, vary=()):
+    """
+    Return the cached value for (`name`, `vary`) at the current versions of
+    `namespaces`, calling `compute()` to fill it on a miss.
+    """
+    cache = _cache()
+    parts = [name, *map(str, vary), *map(str, get_versions(namespaces))]
+    key = f"{KEY_PREFIX}:{hashlib.md5('|'.join(parts).encode('utf-8')).hexdigest()}"
+
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    timeout = getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 24 * 60 * 60)
+    lock_timeout = getattr(settings, 'RESPONSE_CACHE_LOCK_TIMEOUT', 10)
+    lock_key = f'{key}:lock'
+
+    if cache.add(lock_key, 1, lock_timeout):
+        try:
+            value = compute()
+            cache.set(key, value, timeout)
+        finally:
+            cache.delete(lock_key)
+        return value
+
+    # Another caller is recomputing this entry: wait for it rather than
+    # running the same query concurrently.
+    deadline = time.monotonic() + lock_timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        value = cache.get(key)
+        if value is not None:
+            return value
+        if cache.get(lock_key) is None:
+            break
+    return compute()
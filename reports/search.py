@@ -0,0 +1,77 @@
+"""
+Full-text search over Report.description.
+
+The index is maintained by the database itself, so bulk inserts and
+queryset updates stay searchable without going through Report.save():
+
+  * PostgreSQL: a generated `search_vector` tsvector column with a GIN index.
+  * SQLite: an FTS5 external-content table kept in sync by triggers.
+
+Both are created by migration 0012. Other backends fall back to a
+case-insensitive substring match with no ranking.
+"""
+import re
+
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+# Longer queries are truncated rather than rejected.
+MAX_TERMS = 8
+
+FTS_TABLE = 'reports_report_fts'
+
+
+def parse_terms(query):
+    """Lower-cased word tokens; anything that is not a letter or digit is dropped."""
+    return re.findall(r'[^\W_]+', query.lower())[:MAX_TERMS]
+
+
+def _postgresql(queryset, terms):
+    table = queryset.model._meta.db_table
+    # Every term is a prefix match, so "sil sed" finds "silver sedan".
+    tsquery = ' & '.join(f'{term}:*' for term in terms)
+    matches = RawSQL(
+        f"{table}.search_vector @@ to_tsquery('english', %s)", (tsquery,), output_field=BooleanField()
+    )
+    rank = RawSQL(
+        f"ts_rank_cd({table}.search_vector, to_tsquery('english', %s))", (tsquery,), output_field=FloatField()
+    )
+    return queryset.filter(matches).annotate(rank=rank)
+
+
+def _sqlite(queryset, terms):
+    table = queryset.model._meta.db_table
+    match = ' AND '.join(f'"{term}"*' for term in terms)
+    matched_ids = RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", (match,))
+    # bm25() is "lower is better"; negate it so rank sorts like PostgreSQL's.
+    rank = RawSQL(
+        f"(SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND rowid = {table}.id)",
+        (match,),
+        output_field=FloatField(),
+    )
+    return queryset.filter(id__in=matched_ids).annotate(rank=rank)
+
+
+def _fallback(queryset, terms):
+    condition = Q()
+    for term in terms:
+        condition &= Q(description__icontains=term)
+    return queryset.filter(condition).annotate(rank=Value(0.0, output_field=FloatField()))
+
+
+def search_reports(queryset, query):
+    """
+    Filter `queryset` to reports whose description matches every term of
+    `query` (prefix matching) and annotate each with a relevance `rank`.
+    """
+    terms = parse_terms(query)
+    if not terms:
+        return queryset.annotate(rank=Value(0.0, output_field=FloatField())).none()
+
+    vendor = connections[queryset.db].vendor
+    if vendor == 'postgresql':
+        return _postgresql(queryset, terms)
+    if vendor == 'sqlite':
+        return _sqlite(queryset, terms)
+    return _fallback(queryset, terms)
@@ -1,9 +1,100 @@
-from rest_framework import serializers
+from django.conf import settings
+from django.db import models
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
 from .models import Report
 
+
+class ReportListSerializer(serializers.ListSerializer):
+    """
+    Read-only fast path used by ReportSerializer(many=True).
+
+    Instead of running every field's to_representation per row, rows are read
+    as flat tuples (straight from `.values_list()` when given a queryset),
+    `location` is built inline and datetimes are formatted column by column.
+    The output is identical to serializing each report with ReportSerializer.
+    """
+    value_fields = (
+        'id', 'user_id', 'category', 'description', 'latitude', 'longitude',
+        'status', 'created_at', 'updated_at',
+    )
+
+    @classmethod
+    def values(cls, queryset):
+        """Narrow a report queryset to the columns this serializer reads."""
+        return queryset.values(*cls.value_fields)
+
+    def _rows(self, data):
+        if isinstance(data, models.manager.BaseManager):
+            data = data.all()
+        if isinstance(data, models.QuerySet):
+            return list(data.values_list(*self.value_fields))
+        fields = self.value_fields
+        return [
+            tuple(item[name] for name in fields) if isinstance(item, dict)
+            else tuple(getattr(item, name) for name in fields)
+            for item in data
+        ]
+
+    def _format_datetimes(self, field_name, values):
+        field = self.child.fields[field_name]
+        output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+        field_timezone = getattr(field, 'timezone', field.default_timezone())
+        if (
+            output_format is None
+            or output_format.lower() != ISO_8601
+            or not settings.USE_TZ
+            or field_timezone is None
+        ):
+            return [field.to_representation(value) for value in values]
+
+        formatted = []
+        for value in values:
+            if not value:
+                formatted.append(None)
+                continue
+            if isinstance(value, str):
+                formatted.append(value)
+                continue
+            if not value.tzinfo:
+                formatted.append(field.to_representation(value))
+                continue
+            value = value.astimezone(field_timezone).isoformat()
+            if value.endswith('+00:00'):
+                value = value[:-6] + 'Z'
+            formatted.append(value)
+        return formatted
+
+    def to_representation(self, data):
+        rows = self._rows(data)
+        if not rows:
+            return []
+
+        columns = list(zip(*rows))
+        created = self._format_datetimes('created_at', columns[7])
+        updated = self._format_datetimes('updated_at', columns[8])
+
+        return [
+            {
+                'id': pk,
+                'user': user_id,
+                'category': category,
+                'description': description,
+                'latitude': float(latitude),
+                'longitude': float(longitude),
+                'location': f"Lat: {latitude}, Lon: {longitude}",
+                'status': str(status),
+                'created_at': created_at,
+                'updated_at': updated_at,
+            }
+            for (pk, user_id, category, description, latitude, longitude, status, _, _), created_at, updated_at
+            in zip(rows, created, updated)
+        ]
+
+
 class ReportSerializer(serializers.ModelSerializer):
     # The status field will be optional, and will default to 'pending' if not provided
-    status = serializers.CharField(required=False, default='pending')
+    status = serializers.ChoiceField(choices=Report.STATUS_CHOICES, required=False, default='pending')
 
     class Meta:
         model = Report
@@ -20,6 +111,7 @@ class ReportSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'location']  # location is auto-filled
+        list_serializer_class = ReportListSerializer
 
     def create(self, validated_data):
         """
@@ -49,3 +141,25 @@ class ReportSerializer(serializers.ModelSerializer):
             if 'status' in data:
                 raise serializers.ValidationError("You are not authorized to modify the status of a report.")
         return data
+
+
+class ReportBulkItemSerializer(ReportSerializer):
+    """
+    Validates one item of a bulk submission. The submitting user is taken
+    from the request, so `user` is read-only here and no per-item user
+    lookup query is issued.
+    """
+
+    class Meta(ReportSerializer.Meta):
+        read_only_fields = ReportSerializer.Meta.read_only_fields + ['user']
+
+    def validate(self, data):
+        """
+        Only reject a status the submitter actually sent; the 'pending'
+        default must not count as a citizen modifying the status.
+        """
+        request = self.context.get('request')
+        if request and request.user.role not in ['admin', 'law_enforcement']:
+            if 'status' in self.initial_data:
+                raise serializers.ValidationError("You are not authorized to modify the status of a report.")
+        return data
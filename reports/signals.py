@@ -0,0 +1,64 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from .history import record_status_changes
+from .response_cache import bump_version
+
+# Sent after Report.objects.bulk_create(), which fires no post_save, inside
+# the same transaction.
+#
+# `reports` is the list of created Report instances (with ids).
+reports_created = Signal()
+
+# Sent once per batch of status transitions, inside the transaction that
+# made them: by bulk updates (which fire no post_save) and by Report.save()
+# for its own transition.
+#
+# `changes` is a list of dicts with keys:
+#   id, user_id, category, geohash, created_at, old_status, new_status
+# `changed_by` is the user who made the change, if known, and `changed_at`
+# when (default now). `saved` is True when sent by Report.save(): receivers
+# that also handle post_save must not apply those changes twice.
+report_status_changed = Signal()
+
+
+# ----- Status transitions made by Report.save() -----
+
+@receiver(post_save, sender='reports.Report')
+def send_saved_status_change(sender, instance, created, raw=False, **kwargs):
+    # Report.save() records the state the instance was loaded with.
+    previous = getattr(instance, 'previous_state', None)
+    if raw or created or not previous or previous['status'] == instance.status:
+        return
+    report_status_changed.send(
+        sender=sender,
+        changes=[{
+            'id': instance.pk,
+            'user_id': instance.user_id,
+            'category': instance.category,
+            'geohash': instance.geohash,
+            'created_at': instance.created_at,
+            'old_status': previous['status'],
+            'new_status': instance.status,
+        }],
+        changed_by=getattr(instance, 'changed_by', None),
+        changed_at=instance.updated_at,
+        saved=True,
+    )
+
+
+# ----- Status history -----
+
+@receiver(report_status_changed)
+def record_status_history(sender, changes, changed_by=None, changed_at=None, **kwargs):
+    record_status_changes(changes, changed_by=changed_by, changed_at=changed_at)
+
+
+# ----- Response cache invalidation -----
+
+@receiver(post_save, sender='reports.Report')
+@receiver(post_delete, sender='reports.Report')
+@receiver(reports_created)
+@receiver(report_status_changed)
+def invalidate_report_responses(sender, **kwargs):
+    bump_version('reports')
@@ -1,3 +1,118 @@
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from users.models import CustomUser
+from .models import Report
+from .pagination import ReportCursorPagination
+from .views import AllReportsReadOnlyView, ManageReportsView, ReportListCreateView, ReportsSummaryView
+
+
+class QueryPlanTestCase(TestCase):
+    """
+    Fail when a hot list query falls back to a full table scan plus sort.
+    """
+
+    def assertUsesIndex(self, queryset):
+        self.assertPlanUsesIndex(queryset.explain)
+
+    def assertQueryUsesIndex(self, sql, params):
+        """Same check for SQL captured from a view (see `capture_queries`)."""
+        def explain():
+            with connection.cursor() as cursor:
+                cursor.execute(f'{connection.ops.explain_query_prefix()} {sql}', params)
+                return '\n'.join(' '.join(map(str, row)) for row in cursor.fetchall())
+        self.assertPlanUsesIndex(explain)
+
+    def assertPlanUsesIndex(self, explain):
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                # Tiny test tables make a seq scan cheapest; force the planner
+                # to show whether a usable index exists at all.
+                cursor.execute('SET enable_seqscan = off')
+            try:
+                plan = explain()
+            finally:
+                with connection.cursor() as cursor:
+                    cursor.execute('RESET enable_seqscan')
+            self.assertNotIn('Seq Scan', plan, plan)
+            self.assertNotIn('Sort', plan, plan)
+        elif connection.vendor == 'sqlite':
+            plan = explain()
+            self.assertIn('USING INDEX', plan, plan)
+            self.assertNotIn('TEMP B-TREE', plan, plan)
+        else:
+            self.skipTest(f"No plan assertions for {connection.vendor}")
+
+    @contextmanager
+    def capture_queries(self):
+        """Collect the (sql, params) of every query run inside the block."""
+        queries = []
+
+        def record(execute, sql, params, many, context):
+            queries.append((sql, params))
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(record):
+            yield queries
+
+
+class ReportQueryPlanTests(QueryPlanTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            email='citizen@example.com', username='citizen', password='pass', role='citizen'
+        )
+        cls.officer = CustomUser.objects.create_user(
+            email='officer@example.com', username='officer', password='pass', role='law_enforcement'
+        )
+        Report.objects.create(user=cls.user, category='theft', description='Stolen bike')
+        Report.objects.create(user=cls.user, category='fraud', description='Card cloned')
+
+    def page_queryset(self, view_class, user, params=None, url='/api/reports/'):
+        """The page query `view_class` runs for `user` and `params`, built by the view and its paginator."""
+        request = Request(APIRequestFactory().get(url, params or {}))
+        request.user = user
+        view = view_class(request=request)
+        return ReportCursorPagination().page_queryset(view.get_queryset(), request)
+
+    def next_cursor(self, view_class, user, params=None):
+        request = Request(APIRequestFactory().get('/api/reports/', {**(params or {}), 'page_size': 1}))
+        request.user = user
+        paginator = ReportCursorPagination()
+        paginator.paginate_queryset(view_class(request=request).get_queryset(), request)
+        return Request(APIRequestFactory().get(paginator.get_next_link())).query_params['cursor']
+
+    def test_list_in_created_order(self):
+        for view_class in (ReportListCreateView, ManageReportsView, AllReportsReadOnlyView):
+            with self.subTest(view=view_class.__name__):
+                self.assertUsesIndex(self.page_queryset(view_class, self.officer))
+
+    def test_filters_in_created_order(self):
+        for params in ({'status': 'pending'}, {'category': 'theft'}, {'user': str(self.user.pk)}):
+            for view_class in (ReportListCreateView, ManageReportsView):
+                with self.subTest(view=view_class.__name__, **params):
+                    self.assertUsesIndex(self.page_queryset(view_class, self.officer, params))
+
+    def test_next_page(self):
+        for params in ({}, {'status': 'pending'}):
+            with self.subTest(**params):
+                cursor = self.next_cursor(ManageReportsView, self.officer, params)
+                self.assertUsesIndex(
+                    self.page_queryset(ManageReportsView, self.officer, {**params, 'cursor': cursor})
+                )
 
-# Create your tests here.
+    def test_citizen_summary(self):
+        cache.clear()
+        request = APIRequestFactory().get('/api/reports/summary/')
+        force_authenticate(request, user=self.user)
+        with self.capture_queries() as queries:
+            response = ReportsSummaryView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        summary = [(sql, params) for sql, params in queries if Report._meta.db_table in sql]
+        self.assertEqual(len(summary), 1, summary)
+        self.assertQueryUsesIndex(*summary[0])
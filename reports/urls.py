@@ -1,22 +1,32 @@
 from django.urls import path
 from .views import (
     ReportListCreateView,
+    ReportBulkCreateView,
     ReportDetailView,
     ManageReportsView,
+    BulkStatusUpdateView,
     RoleRedirectView,
     CurrentUserView,
     AllReportsReadOnlyView,
+    ReportExportView,
+    NearbyReportsView,
+    ReportSearchView,
     ReportsSummaryView,
     ReportStatusChoicesView  # ✅ Added this import
 )
 
 urlpatterns = [
     path('', ReportListCreateView.as_view(), name='report-list-create'),
+    path('bulk/', ReportBulkCreateView.as_view(), name='report-bulk-create'),
     path('<int:pk>/', ReportDetailView.as_view(), name='report-detail'),
     path('manage/', ManageReportsView.as_view(), name='manage-reports'),
+    path('manage/bulk-status/', BulkStatusUpdateView.as_view(), name='manage-reports-bulk-status'),
     path('redirect/', RoleRedirectView.as_view(), name='role-redirect'),
     path('me/', CurrentUserView.as_view(), name='current-user'),
     path('all/', AllReportsReadOnlyView.as_view(), name='all-reports-read-only'),
+    path('export/<str:export_format>/', ReportExportView.as_view(), name='report-export'),
+    path('nearby/', NearbyReportsView.as_view(), name='reports-nearby'),
+    path('search/', ReportSearchView.as_view(), name='reports-search'),
     path('summary/', ReportsSummaryView.as_view(), name='reports-summary'),
     path('status-choices/', ReportStatusChoicesView.as_view(), name='report-status-choices'),  # ✅ Added this route
 ]
@@ -3,11 +3,23 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import status
-from django.http import JsonResponse
-from django.db.models import Count, Case, When, Value, CharField, F
-
+from django.conf import settings
+from django.db import transaction
+from django.http import JsonResponse, StreamingHttpResponse
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+
+from . import geo, response_cache
+from .aggregation import summarize
+from .conditional import conditional_get, queryset_state
+from .export import EXPORT_FORMATS, stream_reports
+from .filters import BBOX_PARAMS, filter_reports, within_bbox
 from .models import Report
-from .serializers import ReportSerializer
+from .pagination import ReportCursorPagination
+from .search import search_reports
+from .signals import report_status_changed, reports_created
+from .serializers import ReportBulkItemSerializer, ReportListSerializer, ReportSerializer
 
 
 # ----- Permissions -----
@@ -34,6 +46,48 @@ class CanDeleteReport(BasePermission):
         return False
 
 
+# ----- Conditional GET validators -----
+
+def _filtered_reports_state(request, *args, **kwargs):
+    return queryset_state(filter_reports(Report.objects.all(), request.query_params))
+
+
+def _own_reports(request):
+    reports = Report.objects.all()
+    if request.user.role == 'citizen':
+        reports = reports.filter(user=request.user)
+    return reports
+
+
+def _own_reports_summary(request):
+    """
+    Cached summary payload plus its validators. Computed with one query on a
+    miss; served without touching the database until reports change.
+    """
+    user = request.user
+
+    def compute():
+        summary = summarize(_own_reports(request), extra={'last_modified': Max('updated_at')})
+        return {
+            'last_modified': summary.extra['last_modified'],
+            'count': summary.total,
+            'data': {
+                "total_reports": summary.total,
+                "reports_by_status": summary.status_list(),
+                "reports_by_category": summary.category_list(),
+            },
+        }
+
+    vary = (user.role, user.pk if user.role == 'citizen' else '')
+    return response_cache.cached('reports-summary', ['reports'], compute, vary=vary)
+
+
+def _own_reports_state(request, *args, **kwargs):
+    entry = _own_reports_summary(request)
+    request.report_summary = entry
+    return entry['last_modified'], entry['count']
+
+
 # ----- Views -----
 
 class ReportListCreateView(APIView):
@@ -46,8 +100,13 @@ class ReportListCreateView(APIView):
             return [IsAuthenticated(), CanViewReports()]
         return [IsAuthenticated()]
 
+    def get_queryset(self):
+        """The filtered list query, narrowed to the columns the list serializer reads."""
+        return ReportListSerializer.values(filter_reports(Report.objects.all(), self.request.query_params))
+
     def get(self, request):
-        reports = Report.objects.all()
+        paginator = ReportCursorPagination()
+        reports = paginator.paginate_queryset(self.get_queryset(), request)
         serializer = ReportSerializer(reports, many=True)
 
         # Include status choices in the response
@@ -58,8 +117,10 @@ class ReportListCreateView(APIView):
 
         return Response({
             "reports": serializer.data,
-            "status_choices": status_choices
-        })
+            "status_choices": status_choices,
+            "next": paginator.get_next_link(),
+            "previous": paginator.get_previous_link(),
+        }, headers=paginator.get_headers())
 
     def post(self, request):
         data = request.data
@@ -72,6 +133,60 @@ class ReportListCreateView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class ReportBulkCreateView(APIView):
+    """
+    Submit many reports in one request (partner feeds, offline queues).
+
+    The body is a JSON array of reports. Each item is validated on its own;
+    valid items are inserted with bulk_create in chunks inside a single
+    transaction, invalid ones are reported back with their errors.
+    """
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated, CanSubmitReport]
+
+    def post(self, request):
+        items = request.data
+        if not isinstance(items, list):
+            return JsonResponse({"error": "Expected a JSON array of reports."}, status=400)
+
+        max_items = getattr(settings, 'REPORTS_BULK_MAX_ITEMS', 5000)
+        if len(items) > max_items:
+            return JsonResponse({"error": f"At most {max_items} reports per request."}, status=400)
+
+        results = [None] * len(items)
+        pending = []
+        for index, item in enumerate(items):
+            serializer = ReportBulkItemSerializer(data=item, context={'request': request})
+            if serializer.is_valid():
+                report = Report(user=request.user, **serializer.validated_data)
+                report.geohash = geo.encode(report.latitude, report.longitude)
+                pending.append((index, report))
+            else:
+                results[index] = {"index": index, "status": "error", "errors": serializer.errors}
+
+        chunk_size = getattr(settings, 'REPORTS_BULK_CHUNK_SIZE', 500)
+        with transaction.atomic():
+            created = Report.objects.bulk_create([report for _, report in pending], batch_size=chunk_size)
+            if created:
+                reports_created.send(sender=Report, reports=created)
+
+        for (index, _), report in zip(pending, created):
+            results[index] = {"index": index, "status": "created", "id": report.id}
+
+        if not pending and items:
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif len(pending) < len(items):
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_201_CREATED
+
+        return Response({
+            "created": len(pending),
+            "failed": len(items) - len(pending),
+            "results": results,
+        }, status=response_status)
+
+
 class ReportDetailView(APIView):
     authentication_classes = [JWTAuthentication]
 
@@ -108,7 +223,7 @@ class ReportDetailView(APIView):
 
         serializer = ReportSerializer(report, data=request.data, partial=True)
         if serializer.is_valid():
-            serializer.save()
+            serializer.save(changed_by=request.user)
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -122,7 +237,7 @@ class ReportDetailView(APIView):
 
         serializer = ReportSerializer(report, data=request.data, partial=True)
         if serializer.is_valid():
-            serializer.save()
+            serializer.save(changed_by=request.user)
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -145,13 +260,17 @@ class ManageReportsView(APIView):
     permission_classes = [IsAuthenticated, CanUpdateReportStatus]
     authentication_classes = [JWTAuthentication]
 
+    def get_queryset(self):
+        return ReportListSerializer.values(filter_reports(Report.objects.all(), self.request.query_params))
+
     def get(self, request):
         if request.user.role not in ['admin', 'law_enforcement']:
             return JsonResponse({"error": "Forbidden"}, status=403)
 
-        reports = Report.objects.all().order_by('-created_at')
+        paginator = ReportCursorPagination()
+        reports = paginator.paginate_queryset(self.get_queryset(), request)
         serializer = ReportSerializer(reports, many=True)
-        return Response(serializer.data)
+        return paginator.get_paginated_response(serializer.data)
 
     def patch(self, request, pk):
         if request.user.role not in ['admin', 'law_enforcement']:
@@ -167,7 +286,7 @@ class ManageReportsView(APIView):
 
         serializer = ReportSerializer(report, data=data, partial=True)
         if serializer.is_valid():
-            serializer.save()
+            serializer.save(changed_by=request.user)
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -187,6 +306,67 @@ class ManageReportsView(APIView):
         return JsonResponse({"message": "Report deleted successfully"}, status=204)
 
 
+class BulkStatusUpdateView(APIView):
+    """
+    Move many reports to one status: {"ids": [...], "status": "resolved"}.
+
+    Reports already in the target status are left untouched. The rest are
+    changed with a single UPDATE, and owners are notified in one batch.
+    """
+    permission_classes = [IsAuthenticated, CanUpdateReportStatus]
+    authentication_classes = [JWTAuthentication]
+
+    def patch(self, request):
+        if request.user.role not in ['admin', 'law_enforcement']:
+            return JsonResponse({"error": "Forbidden"}, status=403)
+
+        new_status = request.data.get('status')
+        if new_status not in dict(Report.STATUS_CHOICES):
+            return JsonResponse({"error": f"Invalid status: {new_status!r}"}, status=400)
+
+        ids = request.data.get('ids')
+        if not isinstance(ids, list) or not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids):
+            return JsonResponse({"error": "'ids' must be a list of report ids."}, status=400)
+        ids = list(dict.fromkeys(ids))
+
+        max_items = getattr(settings, 'REPORTS_BULK_MAX_ITEMS', 5000)
+        if len(ids) > max_items:
+            return JsonResponse({"error": f"At most {max_items} reports per request."}, status=400)
+
+        with transaction.atomic():
+            rows = list(
+                Report.objects.filter(id__in=ids)
+                .select_for_update()
+                .order_by()
+                .values('id', 'user_id', 'category', 'geohash', 'created_at', 'status')
+            )
+            changes = [
+                {
+                    'id': row['id'],
+                    'user_id': row['user_id'],
+                    'category': row['category'],
+                    'geohash': row['geohash'],
+                    'created_at': row['created_at'],
+                    'old_status': row['status'],
+                    'new_status': new_status,
+                }
+                for row in rows if row['status'] != new_status
+            ]
+            changed_ids = [change['id'] for change in changes]
+            if changed_ids:
+                Report.objects.filter(id__in=changed_ids).update(status=new_status, updated_at=timezone.now())
+                report_status_changed.send(sender=Report, changes=changes, changed_by=request.user)
+
+        found = {row['id'] for row in rows}
+        changed = set(changed_ids)
+        return Response({
+            "status": new_status,
+            "updated": changed_ids,
+            "unchanged": [pk for pk in ids if pk in found and pk not in changed],
+            "not_found": [pk for pk in ids if pk not in found],
+        })
+
+
 class RoleRedirectView(APIView):
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
@@ -221,54 +401,125 @@ class AllReportsReadOnlyView(APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated, CanUpdateReportStatus]
 
+    def get_queryset(self):
+        return ReportListSerializer.values(filter_reports(Report.objects.all(), self.request.query_params))
+
+    @method_decorator(conditional_get(_filtered_reports_state))
     def get(self, request):
         if request.user.role not in ['admin', 'law_enforcement']:
             return JsonResponse({"error": "Forbidden"}, status=403)
 
-        reports = Report.objects.all().order_by('-created_at')
+        paginator = ReportCursorPagination()
+        reports = paginator.paginate_queryset(self.get_queryset(), request)
         serializer = ReportSerializer(reports, many=True)
-        return Response(serializer.data)
+        return paginator.get_paginated_response(serializer.data)
 
 
-class ReportsSummaryView(APIView):
+class ReportExportView(APIView):
+    """
+    Stream every report matching the filters as NDJSON, CSV or GeoJSON.
+    Rows are read with a chunked cursor, so memory does not grow with the export.
+    """
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated, CanUpdateReportStatus]
+
+    def get(self, request, export_format):
+        if export_format not in EXPORT_FORMATS:
+            return JsonResponse({"error": f"Unsupported export format: {export_format}"}, status=400)
+
+        reports = filter_reports(Report.objects.all(), request.query_params)
+        response = StreamingHttpResponse(
+            stream_reports(reports, export_format),
+            content_type=EXPORT_FORMATS[export_format],
+        )
+        response['Content-Disposition'] = f'attachment; filename="reports.{export_format}"'
+        return response
+
+
+class NearbyReportsView(APIView):
+    """
+    Reports within `radius_km` of `lat`/`lon` (nearest first, with distance),
+    or inside the box `min_lat`, `min_lon`, `max_lat`, `max_lon` (newest first).
+    The geohash index prunes candidates before exact filtering. The usual list
+    filters (status, category, created range, ...) apply on top.
+    """
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated, CanViewReports]
 
     def get(self, request):
-        user = request.user
-        reports = Report.objects.all()
-        if user.role == 'citizen':
-            reports = reports.filter(user=user)
+        params = request.query_params
+        radius_mode = 'lat' in params or 'lon' in params
+        if radius_mode:
+            try:
+                latitude = float(params['lat'])
+                longitude = float(params['lon'])
+                radius_km = float(params.get('radius_km', 2))
+                if radius_km <= 0:
+                    raise ValueError
+            except (KeyError, ValueError):
+                return JsonResponse({"error": "Provide lat, lon and a positive radius_km."}, status=400)
+        elif not all(key in params for key in BBOX_PARAMS):
+            return JsonResponse({
+                "error": "Provide lat, lon and radius_km, or min_lat, min_lon, max_lat and max_lon."
+            }, status=400)
+
+        limit = ReportCursorPagination().get_page_size(request)
+        reports = filter_reports(Report.objects.all(), params)
+        if radius_mode:
+            reports = within_bbox(reports, *geo.bbox_around(latitude, longitude, radius_km))
+        reports = ReportListSerializer.values(reports)
+
+        if not radius_mode:
+            rows = list(reports.order_by('-created_at', '-id')[:limit])
+            return Response(ReportSerializer(rows, many=True).data)
+
+        nearby = []
+        # Unordered, so the planner can drive the scan from the geohash index.
+        for row in reports.order_by():
+            distance = geo.haversine_km(latitude, longitude, row['latitude'], row['longitude'])
+            if distance <= radius_km:
+                nearby.append((distance, row))
+        nearby.sort(key=lambda item: item[0])
+        nearby = nearby[:limit]
+
+        data = ReportSerializer([row for _, row in nearby], many=True).data
+        for item, (distance, _) in zip(data, nearby):
+            item['distance_km'] = round(distance, 3)
+        return Response(data)
+
+
+class ReportSearchView(APIView):
+    """
+    Full-text search over report descriptions, best matches first.
+    `q` terms are prefix matched; the usual list filters narrow the results.
+    """
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated, CanUpdateReportStatus]
 
-        total_reports = reports.count()
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return JsonResponse({"error": "Query parameter 'q' is required."}, status=400)
 
-        reports_by_status = (
-            reports.values('status')
-            .annotate(count=Count('status'))
-            .order_by('-count')
-        )
+        limit = ReportCursorPagination().get_page_size(request)
+        reports = search_reports(filter_reports(Report.objects.all(), request.query_params), query)
+        reports = reports.order_by('-rank', '-created_at', '-id')
+        rows = list(reports.values(*ReportListSerializer.value_fields, 'rank')[:limit])
 
-        reports_by_category = (
-            reports.annotate(
-                category_cleaned=Case(
-                    When(category='', then=Value('uncategorized')),
-                    default=F('category'),
-                    output_field=CharField()
-                )
-            )
-            .values('category_cleaned')
-            .annotate(count=Count('category_cleaned'))
-            .order_by('-count')
-        )
+        data = ReportSerializer(rows, many=True).data
+        for item, row in zip(data, rows):
+            item['rank'] = row['rank']
+        return Response(data)
 
-        return Response({
-            "total_reports": total_reports,
-            "reports_by_status": list(reports_by_status),
-            "reports_by_category": [
-                {"category": item["category_cleaned"], "count": item["count"]}
-                for item in reports_by_category
-            ]
-        })
+
+class ReportsSummaryView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated, CanViewReports]
+
+    @method_decorator(conditional_get(_own_reports_state))
+    def get(self, request):
+        entry = getattr(request, 'report_summary', None) or _own_reports_summary(request)
+        return Response(entry['data'])
 
 
 class CrimeStatsView(APIView):
@@ -279,14 +530,11 @@ class CrimeStatsView(APIView):
         if request.user.role not in ['admin', 'law_enforcement']:
             return JsonResponse({"error": "Forbidden"}, status=403)
 
-        stats = {
-            "total_reports": Report.objects.count(),
-            "pending": Report.objects.filter(status='pending').count(),
-            "in_progress": Report.objects.filter(status='in_progress').count(),
-            "resolved": Report.objects.filter(status='resolved').count(),
-            "rejected": Report.objects.filter(status='rejected').count(),
-        }
-        return Response(stats)
+        def compute():
+            summary = summarize(Report.objects.all())
+            return {"total_reports": summary.total, **summary.by_status}
+
+        return Response(response_cache.cached('crime-stats', ['reports'], compute))
 
 
 class ReportStatusChoicesView(APIView):